@@ -6,12 +6,13 @@ registers task modules, and sets up retry configuration with exponential backoff
 """
 
 from celery import Celery
-from backend.config.celery_config import get_celery_config
+from backend.config.celery_config import get_celery_config, register_orjson_serializer
 
 # Initialize Celery application
 app = Celery("devops_copilot")
 
-# Load configuration
+# Load configuration (the orjson serializer it names must be registered first)
+register_orjson_serializer()
 app.config_from_object(get_celery_config())
 
 # Auto-discover tasks from workflows package
@@ -3,15 +3,85 @@ Celery configuration for DevOps Copilot workflows.
 
 Configures:
 - Redis broker and result backend
-- Task serialization (JSON)
+- Task serialization (orjson, still accepting JSON)
 - Result expiration (7 days)
 - Task acknowledgment settings
 - Retry policy with exponential backoff
+- Routing of long-running I/O tasks to the io_heavy queue
+- Routing of network-bound tasks to the gevent-pool network queue
+- Routing of ChromaDB writes to the low-concurrency chromadb queue
+- Worker pool size from WORKER_CONCURRENCY
 """
 
 import os
+from decimal import Decimal
 from typing import Dict, Any
+import orjson
 from kombu import Queue
+from kombu.serialization import register
+
+# JSON-compatible serializer backed by orjson (C encoder/decoder, bytes out).
+# "json" stays accepted so messages queued before the switch still decode.
+ORJSON_SERIALIZER = "orjson"
+ORJSON_CONTENT_TYPE = "application/x-orjson"
+
+# Long-running scan and notification tasks, consumed by a dedicated worker
+# started with --prefetch-multiplier=1 so slow tasks are never reserved
+# behind each other while sibling workers sit idle
+IO_HEAVY_QUEUE = "io_heavy"
+IO_HEAVY_TASKS = (
+    "kb_sync.scan_runbooks",
+    "postmortem.notify_stakeholders",
+    "postmortem.notify_published",
+    "postmortem.notify_stakeholders_bulk",
+)
+
+# Every task that writes to the ChromaDB collection (embedding upserts and
+# deletions). Writes serialise on the collection's index lock, so they get
+# their own queue whose worker runs with low concurrency and prefetch 1
+CHROMADB_QUEUE = "chromadb"
+CHROMADB_TASKS = (
+    "kb_sync.regenerate_embeddings",
+    "kb_sync.regenerate_embeddings_batch",
+    "kb_sync.update_chromadb",
+    "postmortem.embed_chromadb",
+)
+
+# Tasks that spend nearly all their time waiting on blocking sockets (the
+# requests-based GitHub client, Redis), consumed by a worker running the
+# gevent pool so hundreds of them can wait concurrently in one process.
+# Nothing CPU-bound belongs here, nor anything running an asyncio loop:
+# runbook search embeds the query with ONNX in-process and would block the
+# hub, and the notification tasks call asyncio.run(), whose running loop is
+# tracked per OS thread, so a second greenlet's asyncio.run() would fail.
+NETWORK_QUEUE = "network"
+NETWORK_TASKS = (
+    "workflows.create_github_issue",
+    "kb_sync.invalidate_cache",
+)
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Encode types orjson doesn't support natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _orjson_dumps(obj: Any) -> bytes:
+    """Serialize a message body with orjson."""
+    return orjson.dumps(obj, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def register_orjson_serializer() -> None:
+    """Register the orjson serializer with kombu; must run before config is loaded."""
+    register(
+        ORJSON_SERIALIZER,
+        _orjson_dumps,
+        orjson.loads,
+        content_type=ORJSON_CONTENT_TYPE,
+        content_encoding="utf-8"
+    )
 
 
 def  get_celery_config() -> Dict[str, Any]:
@@ -30,9 +100,9 @@ def  get_celery_config() -> Dict[str, Any]:
         "result_backend": result_backend,
 
         # Serialization
-        "task_serializer": "json",
-        "result_serializer": "json",
-        "accept_content": ["json"],
+        "task_serializer": ORJSON_SERIALIZER,
+        "result_serializer": ORJSON_SERIALIZER,
+        "accept_content": [ORJSON_SERIALIZER, "json"],
         "timezone": "UTC",
         "enable_utc": True,
 
@@ -56,11 +126,17 @@ def  get_celery_config() -> Dict[str, Any]:
         "task_queues": (
             Queue("celery", routing_key="celery"),
             Queue("workflows", routing_key="workflows.#"),
+            Queue(IO_HEAVY_QUEUE, routing_key=IO_HEAVY_QUEUE),
+            Queue(NETWORK_QUEUE, routing_key=NETWORK_QUEUE),
+            Queue(CHROMADB_QUEUE, routing_key=CHROMADB_QUEUE),
         ),
         "task_default_queue": "celery",
         "task_default_routing_key": "celery",
 
         # Worker settings
+        # Pool size is set per worker deployment to match what its queues
+        # contend on (e.g. ChromaDB's write lock), not the host's CPU count
+        "worker_concurrency": int(os.getenv("WORKER_CONCURRENCY", str(os.cpu_count() or 1))),
         "worker_prefetch_multiplier": 4,
         "worker_max_tasks_per_child": 1000,
 
@@ -70,6 +146,20 @@ def  get_celery_config() -> Dict[str, Any]:
         "broker_connection_retry_on_startup": True,
         
         # Task routing
+        "task_routes": {
+            **{
+                task_name: {"queue": IO_HEAVY_QUEUE, "routing_key": IO_HEAVY_QUEUE}
+                for task_name in IO_HEAVY_TASKS
+            },
+            **{
+                task_name: {"queue": NETWORK_QUEUE, "routing_key": NETWORK_QUEUE}
+                for task_name in NETWORK_TASKS
+            },
+            **{
+                task_name: {"queue": CHROMADB_QUEUE, "routing_key": CHROMADB_QUEUE}
+                for task_name in CHROMADB_TASKS
+            },
+        },
         #"task_routes": {
         #    "workflows.*": {"queue": "workflows"},
         #    "backend.workflows.tasks.incident_tasks.*": {"queue": "workflows"},
@@ -10,12 +10,19 @@ from typing import Dict, Any, List, Optional
 from enum import Enum
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 
 from backend.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# HTTP session shared by all GitHubClient instances in a process, so the TLS
+# connection to the API is kept alive across tasks instead of re-handshaking
+# for every issue. pool_maxsize covers concurrent tasks on a gevent worker.
+_http_session = requests.Session()
+_http_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=50))
+
 
 class CircuitState(str, Enum):
     """Circuit breaker states."""
@@ -177,11 +184,12 @@ class GitHubClient:
             success_threshold=2
         )
 
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Auth is sent per request because the session is shared
+        self.session = _http_session
+        self.headers = {
             "Authorization": f"token {self.token}",
             "Accept": "application/vnd.github.v3+json"
-        })
+        }
 
     def _check_enabled(self):
         """Check if GitHub integration is enabled."""
@@ -244,7 +252,7 @@ class GitHubClient:
             }
 
             try:
-                response = self.session.post(url, json=payload, timeout=10)
+                response = self.session.post(url, json=payload, headers=self.headers, timeout=10)
                 response.raise_for_status()
                 data = response.json()
 
@@ -293,7 +301,7 @@ class GitHubClient:
         def _get():
             url = f"{self.base_url}/repos/{self.repo}/issues/{issue_number}"
             try:
-                response = self.session.get(url, timeout=10)
+                response = self.session.get(url, headers=self.headers, timeout=10)
                 response.raise_for_status()
                 return response.json()
             except RequestException as e:
@@ -10,6 +10,7 @@ from sqlalchemy import String, Integer, Boolean, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from backend.models.base import Base
+from backend.utils.ids import uuid7
 
 
 class ClusterConfig(Base):
@@ -19,7 +20,7 @@ class ClusterConfig(Base):
 
     __tablename__ = "cluster_config"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     kubeconfig_path: Mapped[str] = mapped_column(String(512), nullable=False)
     default_namespace: Mapped[str] = mapped_column(String(255), default="default", nullable=False)
@@ -11,6 +11,7 @@ from sqlalchemy import String, DateTime, Text, Enum, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 from backend.models.base import Base
+from backend.utils.ids import uuid7
 
 
 class IncidentSeverity(str, PyEnum):
@@ -36,7 +37,7 @@ class Incident(Base):
 
     __tablename__ = "incidents"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
     severity: Mapped[IncidentSeverity] = mapped_column(Enum(IncidentSeverity), nullable=False)
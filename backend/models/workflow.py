@@ -2,7 +2,6 @@
 Workflow data models.
 """
 
-import uuid
 from datetime import datetime
 from enum import Enum
 from typing import Optional, Dict, Any
@@ -10,6 +9,7 @@ from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, JSON, ForeignK
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from backend.models.base import Base  # Asegúrate de usar la misma Base
+from backend.utils.ids import uuid7
 import sqlalchemy as sa
 
 class WorkflowType(str, Enum):
@@ -33,7 +33,7 @@ class Workflow(Base):
     
     __tablename__ = "workflows"
     
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     type = Column(SQLEnum(WorkflowType), nullable=False)
     status = Column(SQLEnum(WorkflowStatus), nullable=False, default=WorkflowStatus.PENDING)
     triggered_by = Column(String(255), nullable=True)
@@ -11,6 +11,7 @@ from sqlalchemy import String, Integer, DateTime, Text, Enum, ForeignKey, Index,
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from backend.models.base import Base
+from backend.utils.ids import uuid7
 
 
 class WorkflowStepStatus(str, PyEnum):
@@ -29,7 +30,7 @@ class WorkflowStep(Base):
 
     __tablename__ = "workflow_steps"
 
-    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     workflow_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("workflows.id", ondelete="CASCADE"), nullable=False)
     step_name: Mapped[str] = mapped_column(String(255), nullable=False)
     step_order: Mapped[int] = mapped_column(Integer, nullable=False)
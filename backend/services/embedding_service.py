@@ -4,18 +4,48 @@ ChromaDB embedding service for postmortem documents.
 Handles document chunking, embedding generation, and ChromaDB operations.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Set, Tuple
 import os
-import uuid
 import hashlib
 from datetime import datetime
 import chromadb
+import requests
 from chromadb.config import Settings
+from chromadb.utils import embedding_functions
 
+from backend.utils.ids import uuid7
 from backend.utils.logging import get_logger
+from backend.utils.retry import exponential_backoff_with_jitter
 
 logger = get_logger(__name__)
 
+# Network failures reaching the ChromaDB server that are retried in-process
+# before the calling task escalates to a (much slower) Celery retry
+CHROMADB_TRANSIENT_ERRORS = (
+    ConnectionError,
+    TimeoutError,
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+CHROMADB_MAX_RETRIES = 2
+
+# Redis counter bumped whenever the collection changes; search result caches
+# include it in their key so every worker drops stale results at once
+SEARCH_GENERATION_KEY = "search:generation"
+
+# ONNX Runtime execution providers for the embedding model, in preference
+# order (e.g. "CUDAExecutionProvider,CPUExecutionProvider"); empty uses CPU
+EMBEDDING_ONNX_PROVIDERS = [
+    p.strip() for p in os.getenv("EMBEDDING_ONNX_PROVIDERS", "").split(",") if p.strip()
+]
+
+# all-MiniLM-L6-v2 (384-d) through ONNX Runtime. This is the model Chroma uses
+# by default, pinned explicitly and shared so the model is loaded once per
+# process and chunks are encoded client-side in batches.
+EMBEDDING_FUNCTION = embedding_functions.ONNXMiniLM_L6_V2(
+    preferred_providers=EMBEDDING_ONNX_PROVIDERS or None
+)
+
 
 class EmbeddingService:
     """Service for embedding documents in ChromaDB."""
@@ -52,10 +82,17 @@ class EmbeddingService:
             heartbeat = self.client.heartbeat()
             logger.info(f"ChromaDB heartbeat: {heartbeat}")
             
-            # Get or create collection
+            # Get or create collection. The default embedding function emits
+            # unit-length vectors, so cosine space makes the HNSW distance an
+            # inner product and 1 - distance a true similarity score. The space
+            # is fixed when a collection is created; existing ones keep theirs.
             self.collection = self.client.get_or_create_collection(
                 name=self.collection_name,
-                metadata={"description": "Postmortem documents for RAG"}
+                embedding_function=EMBEDDING_FUNCTION,
+                metadata={
+                    "description": "Postmortem documents for RAG",
+                    "hnsw:space": "cosine"
+                }
             )
 
             logger.info(
@@ -100,43 +137,22 @@ class EmbeddingService:
         if not document: #or not document.strip():
             raise ValueError("Cannot embed empty document")
 
-        # Prepare metadata
-        doc_metadata = metadata or {}
-        doc_metadata.update({
-            "incident_id": incident_id,
-            "document_type": "postmortem",
-            "indexed_at": datetime.now().isoformat(),
-            "char_count": len(document)
-        })
-
         # Check if document already exists
         existing = self._check_existing_document(incident_id)
 
         try:
-            # Chunk document if it's large
-            chunks = self._chunk_document(document)
+            # Chunk document and build per-chunk IDs and metadata
+            embedding_ids, chunks, chunk_metadata = self._prepare_chunks(
+                incident_id, document, metadata
+            )
             logger.info(f"Document chunked into {len(chunks)} parts")
 
-            # Generate embedding IDs
-            embedding_ids = [
-                str(uuid.uuid4()) for _ in range(len(chunks))
-            ]
-
-            # Add chunk metadata
-            chunk_metadata = []
-            for i, chunk in enumerate(chunks):
-                chunk_meta = doc_metadata.copy()
-                chunk_meta["chunk_index"] = i
-                chunk_meta["total_chunks"] = len(chunks)
-                chunk_meta["chunk_char_count"] = len(chunk)
-                chunk_metadata.append(chunk_meta)
-
-            # Upsert to ChromaDB
-            self.collection.upsert(
+            # Upsert to ChromaDB (idempotent, so safe to retry)
+            self._call_with_retry(lambda: self.collection.upsert(
                 ids=embedding_ids,
                 documents=chunks,
                 metadatas=chunk_metadata
-            )
+            ))
 
             operation = "updated" if existing else "created"
             logger.info(
@@ -156,6 +172,152 @@ class EmbeddingService:
             logger.error(f"ChromaDB embedding failed for incident {incident_id}: {exc}")
             raise
 
+    def embed_batch(
+        self,
+        documents: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Embed several documents with a single ChromaDB upsert.
+
+        All chunks from all documents are sent in one upsert call, so the
+        collection's embedding function encodes them as one batch instead of
+        one small batch per document.
+
+        Args:
+            documents: List of dicts with:
+                - incident_id: Document identifier
+                - document: Document text
+                - metadata: Optional metadata to store with document
+
+        Returns:
+            List of per-document results, in input order, with the same
+            shape as embed_document
+
+        Raises:
+            ValueError: If any document is empty
+            Exception: If ChromaDB operation fails
+        """
+        logger.info(f"Embedding batch of {len(documents)} documents")
+
+        if not documents:
+            return []
+
+        for doc in documents:
+            if not doc["document"]:
+                raise ValueError(f"Cannot embed empty document: {doc['incident_id']}")
+
+        existing_ids = self._check_existing_documents(
+            [doc["incident_id"] for doc in documents]
+        )
+
+        try:
+            all_ids: List[str] = []
+            all_chunks: List[str] = []
+            all_metadata: List[Dict[str, Any]] = []
+            results = []
+
+            for doc in documents:
+                embedding_ids, chunks, chunk_metadata = self._prepare_chunks(
+                    doc["incident_id"], doc["document"], doc.get("metadata")
+                )
+                all_ids.extend(embedding_ids)
+                all_chunks.extend(chunks)
+                all_metadata.extend(chunk_metadata)
+                results.append({
+                    "embedding_id": embedding_ids[0],  # Primary embedding ID
+                    "collection": self.collection_name,
+                    "status": "indexed",
+                    "chunks": len(chunks),
+                    "operation": "updated" if doc["incident_id"] in existing_ids else "created"
+                })
+
+            # Single upsert for the whole batch
+            self._call_with_retry(lambda: self.collection.upsert(
+                ids=all_ids,
+                documents=all_chunks,
+                metadatas=all_metadata
+            ))
+
+            logger.info(
+                f"Successfully embedded batch of {len(documents)} documents "
+                f"({len(all_chunks)} chunks)"
+            )
+            return results
+
+        except Exception as exc:
+            logger.error(f"ChromaDB batch embedding failed: {exc}")
+            raise
+
+    def _call_with_retry(self, func: Callable[[], Any]) -> Any:
+        """
+        Run a ChromaDB call, retrying transient network errors in-process.
+
+        Delays grow exponentially from 0.1s (capped at 2s) with random jitter,
+        so workers that lost the server at the same moment do not reconnect in
+        lockstep. Other errors, and the last transient one, propagate.
+
+        Args:
+            func: Zero-argument callable performing the ChromaDB request
+
+        Returns:
+            Any: The result of func
+        """
+        return exponential_backoff_with_jitter(
+            func,
+            max_retries=CHROMADB_MAX_RETRIES,
+            base_delay=0.1,
+            max_delay=2.0,
+            exceptions=CHROMADB_TRANSIENT_ERRORS,
+            on_retry=lambda attempt, delay: logger.warning(
+                f"Transient ChromaDB error, retry {attempt}/{CHROMADB_MAX_RETRIES} in {delay:.2f}s"
+            )
+        )
+
+    def _prepare_chunks(
+        self,
+        incident_id: str,
+        document: str,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Tuple[List[str], List[str], List[Dict[str, Any]]]:
+        """
+        Chunk a document and build the IDs and metadata for each chunk.
+
+        Args:
+            incident_id: Document identifier
+            document: Document text
+            metadata: Optional metadata to store with every chunk
+
+        Returns:
+            Tuple of (embedding_ids, chunks, chunk_metadata)
+        """
+        # Prepare metadata
+        doc_metadata = metadata or {}
+        doc_metadata.update({
+            "incident_id": incident_id,
+            "document_type": "postmortem",
+            "indexed_at": datetime.now().isoformat(),
+            "char_count": len(document)
+        })
+
+        # Chunk document if it's large
+        chunks = self._chunk_document(document)
+
+        # Generate embedding IDs
+        embedding_ids = [
+            str(uuid7()) for _ in range(len(chunks))
+        ]
+
+        # Add chunk metadata
+        chunk_metadata = []
+        for i, chunk in enumerate(chunks):
+            chunk_meta = doc_metadata.copy()
+            chunk_meta["chunk_index"] = i
+            chunk_meta["total_chunks"] = len(chunks)
+            chunk_meta["chunk_char_count"] = len(chunk)
+            chunk_metadata.append(chunk_meta)
+
+        return embedding_ids, chunks, chunk_metadata
+
     def _chunk_document(
         self,
         document: str,
@@ -219,37 +381,72 @@ class EmbeddingService:
         except Exception:
             return False
 
+    def _check_existing_documents(self, incident_ids: List[str]) -> Set[str]:
+        """
+        Check which documents already exist in ChromaDB with one query.
+
+        Args:
+            incident_ids: Document identifiers
+
+        Returns:
+            Set of identifiers that already have embeddings
+        """
+        try:
+            results = self.collection.get(
+                where={"incident_id": {"$in": incident_ids}},
+                include=["metadatas"]
+            )
+            return {meta["incident_id"] for meta in results["metadatas"]}
+        except Exception:
+            return set()
+
     def search_similar_documents(
         self,
         query: str,
-        n_results: int = 5
+        n_results: int = 5,
+        include_documents: bool = True
     ) -> List[Dict[str, Any]]:
         """
         Search for similar postmortem documents.
 
+        Ranking (top-k by distance) happens inside ChromaDB's index; only the
+        n_results winners come back, as parallel columns.
+
         Args:
             query: Search query
             n_results: Number of results to return
+            include_documents: Whether to fetch chunk text; callers that only
+                need metadata and scores can skip it (document is then None)
 
         Returns:
             List of similar documents with metadata and scores
         """
         logger.info(f"Searching for similar documents: query='{query[:50]}...'")
 
+        include = ["metadatas", "distances"]
+        if include_documents:
+            include.append("documents")
+
         try:
-            results = self.collection.query(
+            results = self._call_with_retry(lambda: self.collection.query(
                 query_texts=[query],
-                n_results=n_results
-            )
-
-            documents = []
-            for i in range(len(results["ids"][0])):
-                documents.append({
-                    "id": results["ids"][0][i],
-                    "document": results["documents"][0][i],
-                    "metadata": results["metadatas"][0][i],
-                    "distance": results["distances"][0][i]
-                })
+                n_results=n_results,
+                include=include
+            ))
+
+            ids = results["ids"][0]
+            texts = results["documents"][0] if include_documents else [None] * len(ids)
+            documents = [
+                {
+                    "id": doc_id,
+                    "document": text,
+                    "metadata": metadata,
+                    "distance": distance
+                }
+                for doc_id, text, metadata, distance in zip(
+                    ids, texts, results["metadatas"][0], results["distances"][0]
+                )
+            ]
 
             logger.info(f"Found {len(documents)} similar documents")
             return documents
@@ -271,9 +468,9 @@ class EmbeddingService:
         logger.info(f"Deleting document for incident {incident_id}")
 
         try:
-            self.collection.delete(
+            self._call_with_retry(lambda: self.collection.delete(
                 where={"incident_id": incident_id}
-            )
+            ))
 
             logger.info(f"Successfully deleted document for incident {incident_id}")
             return {
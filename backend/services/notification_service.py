@@ -5,15 +5,21 @@ This module provides a notification service supporting webhook delivery
 with extensibility for additional channels (email, Slack, etc.).
 """
 
+import asyncio
 import os
-from typing import List, Dict, Any, Optional
-import requests
-from requests.exceptions import RequestException
+from typing import List, Dict, Any, Optional, Tuple
+import httpx
+import orjson
 
 from backend.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Connection pool shared by all channels of a send (and all messages of a bulk send)
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50)
+# Requests wait for a free pooled connection instead of failing with PoolTimeout
+HTTP_TIMEOUT = httpx.Timeout(10, pool=None)
+
 
 class NotificationError(Exception):
     """Exception raised for notification delivery failures."""
@@ -67,25 +73,80 @@ class NotificationService:
 
         logger.info("notification_send_started", message=message, channels=channels)
 
+        # Channels are delivered concurrently, so latency is ~max(channel RTT)
+        outcomes = asyncio.run(self._send_many([(message, metadata)], channels))[0]
+        result = self._summarize(channels, outcomes)
+
+        if result["status"] == "failed":
+            raise NotificationError(f"All notification channels failed: {result['failed']}")
+
+        logger.info(
+            "notification_send_completed",
+            status=result["status"],
+            sent_to=result["sent_to"],
+            failed=result["failed"]
+        )
+        return result
+
+    def send_bulk(
+        self,
+        notifications: List[Dict[str, Any]],
+        channels: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Send many notifications concurrently over a single HTTP connection pool.
+
+        Unlike send(), a notification whose channels all fail is reported
+        with status "failed" instead of raising, so one bad delivery does
+        not abort (or force a resend of) the rest of the batch.
+
+        Args:
+            notifications: List of dicts with "message" and optional "metadata"
+            channels: List of channels ("webhook", "email", "slack")
+
+        Returns:
+            List[Dict[str, Any]]: Per-notification result in input order, each
+            shaped like the return value of send()
+        """
+        if channels is None:
+            channels = ["webhook"]
+
+        logger.info("notification_bulk_send_started", count=len(notifications), channels=channels)
+
+        all_outcomes = asyncio.run(self._send_many(
+            [(n["message"], n.get("metadata")) for n in notifications],
+            channels
+        ))
+        results = [self._summarize(channels, outcomes) for outcomes in all_outcomes]
+
+        logger.info(
+            "notification_bulk_send_completed",
+            count=len(results),
+            failed=sum(1 for r in results if r["status"] == "failed")
+        )
+        return results
+
+    def _summarize(self, channels: List[str], outcomes: List[Any]) -> Dict[str, Any]:
+        """
+        Build a send result from per-channel delivery outcomes.
+
+        Args:
+            channels: Channels in delivery order
+            outcomes: Per-channel outcome returned by _send_all
+
+        Returns:
+            Dict[str, Any]: {"sent_to": [...], "failed": [...], "status": ...}
+        """
         sent_to = []
         failed = []
 
-        for channel in channels:
-            try:
-                if channel == "webhook":
-                    self._send_webhook(message, metadata)
-                    sent_to.append("webhook")
-                elif channel == "email":
-                    logger.warning("notification_channel_not_implemented", channel="email")
-                    failed.append("email")
-                elif channel == "slack":
-                    logger.warning("notification_channel_not_implemented", channel="slack")
-                    failed.append("slack")
-                else:
-                    logger.warning("notification_channel_unknown", channel=channel)
-                    failed.append(channel)
-            except Exception as e:
-                logger.error("notification_channel_failed", channel=channel, error=str(e))
+        for channel, outcome in zip(channels, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error("notification_channel_failed", channel=channel, error=str(outcome))
+                failed.append(channel)
+            elif outcome:
+                sent_to.append(channel)
+            else:
                 failed.append(channel)
 
         # Determine overall status
@@ -95,49 +156,121 @@ class NotificationService:
             status = "partial"
         else:
             status = "failed"
-            raise NotificationError(f"All notification channels failed: {failed}")
 
-        result = {
+        return {
             "sent_to": sent_to,
             "failed": failed,
             "status": status
         }
 
-        logger.info("notification_send_completed", status=status, sent_to=sent_to, failed=failed)
-        return result
+    async def _send_many(
+        self,
+        notifications: List[Tuple[str, Optional[Dict[str, Any]]]],
+        channels: List[str]
+    ) -> List[List[Any]]:
+        """
+        Deliver notifications concurrently, sharing one HTTP client.
+
+        Args:
+            notifications: List of (message, metadata) tuples
+            channels: List of channels to deliver each notification to
 
-    def _send_webhook(self, message: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        Returns:
+            List[List[Any]]: Per-notification channel outcomes (see _send_all)
         """
-        Send notification via webhook (HTTP POST).
+        async with httpx.AsyncClient(timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS) as client:
+            return await asyncio.gather(
+                *(self._send_all(client, message, channels, metadata) for message, metadata in notifications)
+            )
+
+    async def _send_all(
+        self,
+        client: httpx.AsyncClient,
+        message: str,
+        channels: List[str],
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> List[Any]:
+        """
+        Deliver a notification to all channels concurrently.
+
+        The JSON payload is encoded once and the same bytes are sent to
+        every channel.
 
         Args:
+            client: Shared HTTP client
             message: Notification message
+            channels: List of channels to deliver to
             metadata: Optional metadata
 
+        Returns:
+            List[Any]: Per-channel outcome in channel order: True if sent,
+            False if the channel is unavailable, or the raised exception
+        """
+        body = orjson.dumps({
+            "message": message,
+            "timestamp": "auto",  # TODO: Add actual timestamp
+            "metadata": metadata or {}
+        })
+
+        return await asyncio.gather(
+            *(self._send_channel(client, channel, body) for channel in channels),
+            return_exceptions=True
+        )
+
+    async def _send_channel(
+        self,
+        client: httpx.AsyncClient,
+        channel: str,
+        body: bytes
+    ) -> bool:
+        """
+        Deliver a notification to a single channel.
+
+        Args:
+            client: Shared HTTP client
+            channel: Channel name ("webhook", "email", "slack")
+            body: Encoded JSON payload
+
+        Returns:
+            bool: True if sent, False if the channel is not available
+
+        Raises:
+            NotificationError: If delivery fails
+        """
+        if channel == "webhook":
+            await self._send_webhook(client, body)
+            return True
+        elif channel in ("email", "slack"):
+            logger.warning("notification_channel_not_implemented", channel=channel)
+        else:
+            logger.warning("notification_channel_unknown", channel=channel)
+        return False
+
+    async def _send_webhook(self, client: httpx.AsyncClient, body: bytes) -> None:
+        """
+        Send notification via webhook (HTTP POST).
+
+        Args:
+            client: Shared HTTP client
+            body: Encoded JSON payload
+
         Raises:
             NotificationError: If webhook delivery fails
         """
         if not self.webhook_enabled:
             raise NotificationError("Webhook notifications not configured")
 
-        payload = {
-            "message": message,
-            "timestamp": "auto",  # TODO: Add actual timestamp
-            "metadata": metadata or {}
-        }
-
         try:
-            response = requests.post(
+            response = await client.post(
                 self.webhook_url,
-                json=payload,
-                timeout=10,
+                content=body,
                 headers={"Content-Type": "application/json"}
             )
             response.raise_for_status()
 
             logger.info("notification_webhook_success", url=self.webhook_url)
 
-        except RequestException as e:
+        except httpx.HTTPError as e:
             logger.error("notification_webhook_failed", url=self.webhook_url, error=str(e))
             raise NotificationError(f"Webhook delivery failed: {str(e)}")
 
@@ -4,13 +4,14 @@ Synchronization service for knowledge base change detection.
 Tracks file state and detects changes between sync operations.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import json
 import os
 from pathlib import Path
 
 from backend.database import get_db
 from backend.models.workflow import Workflow
+from backend.utils.file_scanner import file_scanner
 from backend.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -44,7 +45,8 @@ class SyncService:
         Detect changes by comparing current files with previous state.
 
         Args:
-            current_files: List of current file info dicts (path, mtime)
+            current_files: List of current file info dicts (path, mtime, size,
+                optional hash)
 
         Returns:
             Dict containing:
@@ -59,25 +61,39 @@ class SyncService:
         # Get previous state
         previous_state = self._load_previous_state()
 
-        # Build current state dict for easy lookup
-        current_state = {
-            file_info["path"]: file_info["mtime"]
-            for file_info in current_files
-        }
+        current_state: Dict[str, Dict[str, Any]] = {}
 
         added = []
         modified = []
         deleted = []
         unchanged = []
 
-        # Find added and modified files
-        for path, mtime in current_state.items():
-            if path not in previous_state:
+        # Find added and modified files. A file whose mtime changed but whose
+        # size and content hash did not (e.g. touched by a checkout or copy)
+        # counts as unchanged, so it is not re-embedded.
+        for file_info in current_files:
+            path = file_info["path"]
+            previous = previous_state.get(path)
+            state = {"mtime": file_info["mtime"], "size": file_info.get("size")}
+
+            if previous is None:
+                state["hash"] = self._file_hash(file_info)
                 added.append(path)
-            elif previous_state[path] != mtime:
-                modified.append(path)
-            else:
+            elif previous.get("mtime") == state["mtime"] and previous.get("size", state["size"]) == state["size"]:
+                state["hash"] = previous.get("hash")
                 unchanged.append(path)
+            else:
+                state["hash"] = self._file_hash(file_info)
+                if (
+                    state["hash"] is not None
+                    and state["hash"] == previous.get("hash")
+                    and state["size"] == previous.get("size")
+                ):
+                    unchanged.append(path)
+                else:
+                    modified.append(path)
+
+            current_state[path] = state
 
         # Find deleted files
         for path in previous_state.keys():
@@ -104,19 +120,44 @@ class SyncService:
 
         return result
 
-    def _load_previous_state(self) -> Dict[str, float]:
+    def _file_hash(self, file_info: Dict[str, Any]) -> Optional[str]:
+        """
+        Get the content hash for a scanned file.
+
+        Args:
+            file_info: File info dict from the scan (path, mtime, optional hash)
+
+        Returns:
+            Hex digest of the file content, or None if it can't be read
+        """
+        if file_info.get("hash"):
+            return file_info["hash"]
+        try:
+            return file_scanner.get_file_hash(file_info["path"])
+        except OSError:
+            return None
+
+    def _load_previous_state(self) -> Dict[str, Dict[str, Any]]:
         """
         Load previous file state.
 
+        State saved before sizes and hashes were tracked maps paths to bare
+        mtimes; those entries are read as {"mtime": mtime}.
+
         Returns:
-            Dict mapping file paths to mtimes
+            Dict mapping file paths to {"mtime", "size", "hash"}
         """
         if self.use_database:
-            return self._load_state_from_database()
+            state = self._load_state_from_database()
         else:
-            return self._load_state_from_file()
+            state = self._load_state_from_file()
+
+        return {
+            path: entry if isinstance(entry, dict) else {"mtime": entry}
+            for path, entry in state.items()
+        }
 
-    def _load_state_from_database(self) -> Dict[str, float]:
+    def _load_state_from_database(self) -> Dict[str, Any]:
         """Load state from database metadata."""
         db = next(get_db())
         try:
@@ -139,7 +180,7 @@ class SyncService:
         finally:
             db.close()
 
-    def _load_state_from_file(self) -> Dict[str, float]:
+    def _load_state_from_file(self) -> Dict[str, Any]:
         """Load state from file."""
         if not self.state_file or not os.path.exists(self.state_file):
             logger.info("No previous state file found")
@@ -154,19 +195,19 @@ class SyncService:
             logger.warning(f"Failed to load state from file: {exc}")
             return {}
 
-    def _save_current_state(self, state: Dict[str, float]) -> None:
+    def _save_current_state(self, state: Dict[str, Any]) -> None:
         """
         Save current file state for next comparison.
 
         Args:
-            state: Dict mapping file paths to mtimes
+            state: Dict mapping file paths to {"mtime", "size", "hash"}
         """
         if self.use_database:
             self._save_state_to_database(state)
         else:
             self._save_state_to_file(state)
 
-    def _save_state_to_database(self, state: Dict[str, float]) -> None:
+    def _save_state_to_database(self, state: Dict[str, Any]) -> None:
         """Save state to database metadata."""
         db = next(get_db())
         try:
@@ -191,7 +232,7 @@ class SyncService:
         finally:
             db.close()
 
-    def _save_state_to_file(self, state: Dict[str, float]) -> None:
+    def _save_state_to_file(self, state: Dict[str, Any]) -> None:
         """Save state to file."""
         if not self.state_file:
             return
@@ -13,6 +13,8 @@ from backend.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+POSTMORTEM_TEMPLATE = "postmortem.md.j2"
+
 
 class TemplateService:
     """Service for rendering Jinja2 templates."""
@@ -38,9 +40,13 @@ class TemplateService:
             loader=FileSystemLoader(templates_dir),
             autoescape=False,  # Markdown doesn't need HTML escaping
             trim_blocks=True,
-            lstrip_blocks=True
+            lstrip_blocks=True,
+            auto_reload=False  # Templates don't change during a worker's lifetime
         )
 
+        # Compile the postmortem template once; reused for every render
+        self.postmortem_template = self.env.get_template(POSTMORTEM_TEMPLATE)
+
         logger.info(f"Template service initialized with dir: {templates_dir}")
 
     def render_postmortem(self, context: Dict[str, Any]) -> str:
@@ -73,6 +79,40 @@ class TemplateService:
         """
         logger.info(f"Rendering postmortem template for incident {context.get('incident_id')}")
 
+        render_context = self._postmortem_context(context)
+
+        try:
+            # Render precompiled template
+            rendered = self.postmortem_template.render(**render_context)
+
+            logger.info(
+                f"Successfully rendered postmortem ({len(rendered)} chars) "
+                f"for incident {context['incident_id']}"
+            )
+
+            return rendered
+
+        except TemplateNotFound as exc:
+            logger.error(f"Template not found: {exc}")
+            raise
+        except Exception as exc:
+            logger.error(f"Template rendering failed: {exc}")
+            raise
+
+    def _postmortem_context(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Validate postmortem context and add the pre-rendered list sections.
+
+        Args:
+            context: Template context (see render_postmortem)
+
+        Returns:
+            Context with timeline_rendered, lessons_rendered and
+            action_items_rendered added
+
+        Raises:
+            ValueError: If required context variables missing
+        """
         # Validate required fields
         required_fields = [
             "incident_id", "incident_title", "summary",
@@ -91,26 +131,20 @@ class TemplateService:
         if not isinstance(context["lessons_learned"], list):
             raise ValueError("Lessons learned must be a list")
 
-        try:
-            # Load template
-            template = self.env.get_template("postmortem.md.j2")
-
-            # Render template
-            rendered = template.render(**context)
-
-            logger.info(
-                f"Successfully rendered postmortem ({len(rendered)} chars) "
-                f"for incident {context['incident_id']}"
+        # Pre-render list sections with str.join instead of per-item Jinja loops
+        return {
+            **context,
+            "timeline_rendered": "\n".join(
+                f"- **{event.get('time', '')}** - {event.get('event', '')}"
+                for event in context["timeline"]
+            ),
+            "lessons_rendered": "\n".join(
+                f"- {lesson}" for lesson in context["lessons_learned"]
+            ),
+            "action_items_rendered": "\n".join(
+                f"- [ ] {item}" for item in context.get("action_items") or []
             )
-
-            return rendered
-
-        except TemplateNotFound as exc:
-            logger.error(f"Template not found: {exc}")
-            raise
-        except Exception as exc:
-            logger.error(f"Template rendering failed: {exc}")
-            raise
+        }
 
     def render_custom_template(
         self,
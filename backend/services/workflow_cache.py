@@ -7,32 +7,62 @@ fast dashboard queries without hitting the database.
 
 import os
 import uuid
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 import redis
 import json
+from celery.signals import worker_process_init
+
+# Prefix of the Redis SETs that index cache keys by tag
+TAG_PREFIX = "tag:"
 
 
 class WorkflowCache:
     """Workflow state cache for fast retrieval."""
 
-    def __init__(self, redis_url: Optional[str] = None):
+    def __init__(
+        self,
+        redis_url: Optional[str] = None,
+        max_connections: Optional[int] = None,
+        pool_timeout: int = 5
+    ):
         """
         Initialize workflow cache.
 
+        Connections come from a BlockingConnectionPool: when all
+        max_connections are checked out, callers wait up to pool_timeout
+        seconds for one to be released instead of failing immediately, so
+        max_connections should cover the worker's concurrency (e.g. the
+        gevent network worker). Nothing connects until the first command, so creating the
+        module-level caches at import time does not touch Redis.
+
         Args:
             redis_url: Redis connection URL (defaults to env REDIS_URL)
+            max_connections: Maximum pooled connections per process
+                (defaults to env REDIS_MAX_CONNECTIONS, or 32)
+            pool_timeout: Seconds to wait for a free connection
         """
         self.redis_url = redis_url or os.getenv("REDIS_URL", "redis://localhost:6379/0")
-        self.client = redis.from_url(self.redis_url, decode_responses=True)
+        if max_connections is None:
+            max_connections = int(os.getenv("REDIS_MAX_CONNECTIONS", "32"))
+        self.pool = redis.BlockingConnectionPool.from_url(
+            self.redis_url,
+            max_connections=max_connections,
+            timeout=pool_timeout,
+            decode_responses=True
+        )
+        self.client = redis.Redis(connection_pool=self.pool)
         self.ttl_seconds = 3600  # 1 hour
+        self.scan_count = 1000  # COUNT hint per SCAN iteration
+        self.unlink_batch_size = 500  # UNLINK commands per pipeline round trip
 
-        # Test connection
-        try:
-            self.client.ping()
-            print(f"✅ WorkflowCache __init__ Connected to Redis at {self.redis_url}")
-        except Exception as e:
-            print(f"❌ WorkflowCache __init__ Failed to connect to Redis: {e}")
+    def reset_pool(self) -> None:
+        """
+        Drop all pooled connections so the current process opens its own.
 
+        Call after fork: connections inherited from the parent share sockets
+        with it and with sibling processes.
+        """
+        self.pool.reset()
 
     def get_workflow_state(self, workflow_id: uuid.UUID) -> Optional[Dict[str, Any]]:
         """
@@ -103,6 +133,107 @@ class WorkflowCache:
         key = f"workflow:state:{workflow_id}"
         return bool(self.client.delete(key))
 
+    def get_value(self, key: str) -> Optional[Any]:
+        """
+        Get a cached JSON value.
+
+        Cache errors are treated as a miss so callers can always fall back
+        to computing the value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[Any]: Cached value or None on miss
+        """
+        try:
+            data = self.client.get(key)
+        except redis.RedisError:
+            return None
+
+        if not data:
+            return None
+
+        try:
+            return json.loads(data)
+        except json.JSONDecodeError:
+            return None
+
+    def set_value(self, key: str, value: Any, ttl_seconds: Optional[int] = None) -> bool:
+        """
+        Cache a JSON-serializable value.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl_seconds: Optional TTL override (default: 1 hour)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            self.client.setex(key, ttl_seconds or self.ttl_seconds, json.dumps(value))
+            return True
+        except Exception:
+            return False
+
+    def incr(self, key: str) -> Optional[int]:
+        """
+        Atomically increment an integer counter (created at 0 if missing).
+
+        Args:
+            key: Counter key
+
+        Returns:
+            Optional[int]: New counter value, or None if Redis is unavailable
+        """
+        try:
+            return self.client.incr(key)
+        except redis.RedisError:
+            return None
+
+    def set_tagged(
+        self,
+        key: str,
+        value: Any,
+        tags: List[str],
+        ttl_seconds: Optional[int] = None
+    ) -> bool:
+        """
+        Cache a value and index its key under one or more tags.
+
+        The value and tag memberships are written in a single MULTI/EXEC so
+        a key is never cached without being reachable from its tags.
+        Invalidating "tag:<tag>" later removes every key written with that
+        tag without scanning the keyspace. A tag set's TTL is only ever
+        extended, so it outlives its longest-lived member.
+
+        Args:
+            key: Cache key (e.g., "search:runbook:db_troubleshooting")
+            value: JSON-serializable value
+            tags: Tags to index the key under (e.g., ["runbook:db_troubleshooting"])
+            ttl_seconds: Optional TTL override (default: 1 hour)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        ttl = ttl_seconds or self.ttl_seconds
+
+        try:
+            pipe = self.client.pipeline(transaction=True)
+            pipe.setex(key, ttl, json.dumps(value))
+            for tag in tags:
+                tag_key = f"{TAG_PREFIX}{tag}"
+                pipe.sadd(tag_key, key)
+                # NX sets a TTL on a new tag set; GT then only ever raises it,
+                # so a short-lived write can't expire longer-lived members' tag
+                pipe.expire(tag_key, ttl, nx=True)
+                pipe.expire(tag_key, ttl, gt=True)
+            pipe.execute()
+            return True
+        except Exception:
+            return False
+
     def invalidate_cache(self, cache_keys: list) -> int:
         """
         Invalidate multiple cache keys (for KB sync workflow).
@@ -113,44 +244,66 @@ class WorkflowCache:
         Returns:
             int: Number of keys deleted
         """
-        deleted_count = 0
+        keys = []
         for pattern in cache_keys:
-            keys = self.client.keys(pattern)
-            if keys:
-                deleted_count += self.client.delete(*keys)
-        return deleted_count
+            keys.extend(self._scan_keys(pattern))
+        unlinked, _ = self._unlink_keys(keys)
+        return unlinked
 
     def invalidate_keys(self, cache_keys: list) -> Dict[str, Any]:
         """
         Invalidate multiple cache keys and return detailed status.
 
+        Tag keys ("tag:<tag>", see set_tagged) are resolved with SMEMBERS, and
+        the tag set is removed together with its members (but is not counted
+        in invalidated_keys). Patterns are
+        resolved incrementally with SCAN instead of KEYS so large keyspaces
+        never block the Redis event loop. All matched keys are removed with
+        pipelined UNLINK (memory is reclaimed in the background).
+
         Args:
-            cache_keys: List of cache keys or patterns to invalidate
+            cache_keys: List of cache keys, tag keys or patterns to invalidate
 
         Returns:
             Dict containing:
-            - invalidated_keys: Number of keys invalidated
-            - status: "success" or "partial"
+            - invalidated_keys: Number of cache entries invalidated
+            - status: "success", "partial" or "failed"
+            - failed: Keys whose UNLINK errored (only when status is "partial")
         """
         invalidated_count = 0
 
         try:
+            keys_to_unlink = []
+            tag_keys = []
             for key in cache_keys:
-                # Check if it's a pattern (contains *)
-                if "*" in key:
-                    keys = self.client.keys(key)
-                    if keys:
-                        invalidated_count += self.client.delete(*keys)
+                if key.startswith(TAG_PREFIX):
+                    tag_keys.append(key)
+                # Check if it's a pattern (contains glob characters)
+                elif self._is_pattern(key):
+                    keys_to_unlink.extend(self._scan_keys(key))
                 else:
                     # Direct key
-                    if self.client.delete(key):
-                        invalidated_count += 1
+                    keys_to_unlink.append(key)
+
+            if tag_keys:
+                keys_to_unlink.extend(self._tagged_keys(tag_keys))
+                keys_to_unlink.extend(tag_keys)
 
-            status = "success" if invalidated_count > 0 else "success"
+            invalidated_count, failed_keys = self._unlink_keys(
+                list(dict.fromkeys(keys_to_unlink)),
+                uncounted=frozenset(tag_keys)
+            )
+
+            if failed_keys:
+                return {
+                    "invalidated_keys": invalidated_count,
+                    "status": "partial",
+                    "failed": failed_keys
+                }
 
             return {
                 "invalidated_keys": invalidated_count,
-                "status": status
+                "status": "success"
             }
 
         except Exception as exc:
@@ -160,6 +313,74 @@ class WorkflowCache:
                 "error": str(exc)
             }
 
+    @staticmethod
+    def _is_pattern(key: str) -> bool:
+        """Check whether a cache key contains Redis glob characters."""
+        return any(char in key for char in "*?[")
+
+    def _scan_keys(self, pattern: str) -> List[str]:
+        """
+        Collect keys matching a pattern using non-blocking SCAN.
+
+        Keys are gathered into a list before any deletion so the SCAN cursor
+        is not disturbed by keys disappearing mid-iteration.
+
+        Args:
+            pattern: Redis glob pattern (e.g., "runbook:*")
+
+        Returns:
+            List[str]: Matching keys
+        """
+        return list(self.client.scan_iter(match=pattern, count=self.scan_count))
+
+    def _tagged_keys(self, tag_keys: List[str]) -> List[str]:
+        """
+        Collect the members of tag sets with one pipelined SMEMBERS per tag.
+
+        Args:
+            tag_keys: Tag set keys (e.g., ["tag:runbook:db_troubleshooting"])
+
+        Returns:
+            List[str]: Cache keys indexed under any of the tags
+        """
+        pipe = self.client.pipeline(transaction=False)
+        for tag_key in tag_keys:
+            pipe.smembers(tag_key)
+        return [key for members in pipe.execute() for key in members]
+
+    def _unlink_keys(self, keys: List[str], uncounted: frozenset = frozenset()) -> Tuple[int, List[str]]:
+        """
+        Remove keys with one pipelined UNLINK per key.
+
+        UNLINK frees values in a background thread, so large cached results
+        never stall the Redis main thread the way DEL does. Issuing one
+        command per key lets a failure be attributed to the key that caused
+        it instead of failing the whole batch.
+
+        Args:
+            keys: Keys to remove
+            uncounted: Keys to remove without counting them (e.g. tag sets)
+
+        Returns:
+            Tuple of (number of counted keys removed, keys whose UNLINK failed)
+        """
+        unlinked = 0
+        failed_keys = []
+
+        for start in range(0, len(keys), self.unlink_batch_size):
+            batch = keys[start:start + self.unlink_batch_size]
+            pipe = self.client.pipeline(transaction=False)
+            for key in batch:
+                pipe.unlink(key)
+
+            for key, result in zip(batch, pipe.execute(raise_on_error=False)):
+                if isinstance(result, Exception):
+                    failed_keys.append(key)
+                elif key not in uncounted:
+                    unlinked += result
+
+        return unlinked, failed_keys
+
     def acquire_lock(
         self,
         lock_name: str,
@@ -217,3 +438,13 @@ class WorkflowCache:
             return True
         except Exception:
             return False
+
+
+# Global workflow cache instance (one Redis connection pool per process)
+workflow_cache = WorkflowCache()
+
+
+@worker_process_init.connect
+def _reset_workflow_cache_pool(**kwargs) -> None:
+    """Give each forked worker process a fresh Redis connection pool."""
+    workflow_cache.reset_pool()
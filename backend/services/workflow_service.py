@@ -13,6 +13,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from backend.models.workflow import Workflow, WorkflowType, WorkflowStatus
 from backend.models.workflow_step import WorkflowStep, WorkflowStepStatus
+from backend.utils.ids import uuid7
 
 
 class WorkflowService:
@@ -50,7 +51,7 @@ class WorkflowService:
             SQLAlchemyError: If database operation fails
         """
         workflow = Workflow(
-            id=uuid.uuid4(),
+            id=uuid7(),
             type=workflow_type,
             status=WorkflowStatus.PENDING,
             triggered_by=triggered_by,
@@ -135,7 +136,7 @@ class WorkflowService:
             SQLAlchemyError: If database operation fails
         """
         step = WorkflowStep(
-            id=uuid.uuid4(),
+            id=uuid7(),
             workflow_id=workflow_id,
             step_name=step_name,
             step_order=step_order,
@@ -0,0 +1,101 @@
+"""
+Cached filesystem stat lookups.
+
+Provides an os.path-like helper that stat()s each path at most once, so
+repeated exists/isdir/isfile/islink checks on the same path during a
+single scan do not each cost a syscall.
+"""
+
+import os
+import stat as stat_module
+from typing import Dict, Optional
+
+
+class CachedPath:
+    """
+    os.path-style predicates backed by a per-instance stat cache.
+
+    Results (including "does not exist") are cached until updatecache() is
+    called for the path. Instances are not thread-safe and are meant to be
+    scoped to a single task invocation, so there is no cross-process or
+    cross-thread coherence to maintain.
+    """
+
+    def __init__(self):
+        """Initialize empty stat and lstat caches."""
+        self.statcache: Dict[str, Optional[os.stat_result]] = {}
+        self.lstatcache: Dict[str, Optional[os.stat_result]] = {}
+
+    def updatecache(self, path: str) -> None:
+        """
+        Drop cached results for a path, e.g. after writing to it.
+
+        Args:
+            path: Path to invalidate
+        """
+        path = os.path.normpath(path)
+        self.statcache.pop(path, None)
+        self.lstatcache.pop(path, None)
+
+    def stat(self, path: str) -> Optional[os.stat_result]:
+        """
+        Stat a path, following symlinks.
+
+        Args:
+            path: Path to stat
+
+        Returns:
+            os.stat_result, or None if the path can't be accessed
+        """
+        path = os.path.normpath(path)
+        if path not in self.statcache:
+            try:
+                self.statcache[path] = os.stat(path)
+            except OSError:
+                self.statcache[path] = None
+        return self.statcache[path]
+
+    def lstat(self, path: str) -> Optional[os.stat_result]:
+        """
+        Stat a path without following symlinks.
+
+        Args:
+            path: Path to stat
+
+        Returns:
+            os.stat_result, or None if the path can't be accessed
+        """
+        path = os.path.normpath(path)
+        if path not in self.lstatcache:
+            try:
+                st = os.lstat(path)
+            except OSError:
+                st = None
+            self.lstatcache[path] = st
+            # A non-link lstat is also the stat result
+            if st is not None and not stat_module.S_ISLNK(st.st_mode):
+                self.statcache.setdefault(path, st)
+        return self.lstatcache[path]
+
+    def exists(self, path: str) -> bool:
+        """Return True if path exists (broken symlinks count as missing)."""
+        return self.stat(path) is not None
+
+    def lexists(self, path: str) -> bool:
+        """Return True if path exists (broken symlinks count as existing)."""
+        return self.lstat(path) is not None
+
+    def isfile(self, path: str) -> bool:
+        """Return True if path is a regular file, following symlinks."""
+        st = self.stat(path)
+        return st is not None and stat_module.S_ISREG(st.st_mode)
+
+    def isdir(self, path: str) -> bool:
+        """Return True if path is a directory, following symlinks."""
+        st = self.stat(path)
+        return st is not None and stat_module.S_ISDIR(st.st_mode)
+
+    def islink(self, path: str) -> bool:
+        """Return True if path is a symbolic link."""
+        st = self.lstat(path)
+        return st is not None and stat_module.S_ISLNK(st.st_mode)
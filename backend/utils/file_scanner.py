@@ -4,15 +4,23 @@ File scanning utilities for knowledge base synchronization.
 Provides recursive directory scanning with file metadata tracking.
 """
 
+import hashlib
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import fnmatch
 
+from backend.utils.cachedpath import CachedPath
 from backend.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+SORT_BY_INODE = os.name != "nt"
+
+# Threads used to walk top-level subtrees concurrently
+SCAN_MAX_WORKERS = 8
+
 
 class FileScanner:
     """Service for scanning directories and tracking file metadata."""
@@ -41,31 +49,25 @@ class FileScanner:
         """
         logger.info(f"Scanning directory: {directory} (pattern={pattern}, recursive={recursive})")
 
-        if not os.path.exists(directory):
+        # One stat() answers both checks below
+        cpath = CachedPath()
+
+        if not cpath.exists(directory):
             raise FileNotFoundError(f"Directory not found: {directory}")
 
-        if not os.path.isdir(directory):
+        if not cpath.isdir(directory):
             raise ValueError(f"Not a directory: {directory}")
 
-        files = []
+        files, subdirs = self._scan_dir(directory, pattern)
 
-        if recursive:
-            # Recursive scan
-            for root, dirs, filenames in os.walk(directory):
-                for filename in filenames:
-                    if fnmatch.fnmatch(filename, pattern):
-                        file_path = os.path.join(root, filename)
-                        file_info = self._get_file_info(file_path)
-                        if file_info:
-                            files.append(file_info)
-        else:
-            # Non-recursive scan
-            for entry in os.listdir(directory):
-                file_path = os.path.join(directory, entry)
-                if os.path.isfile(file_path) and fnmatch.fnmatch(entry, pattern):
-                    file_info = self._get_file_info(file_path)
-                    if file_info:
-                        files.append(file_info)
+        if recursive and subdirs:
+            # Subtrees are walked in parallel: the threads spend their time in
+            # readdir/stat syscalls, which release the GIL, so their latency
+            # overlaps. Results are merged in subdirectory order.
+            max_workers = min(SCAN_MAX_WORKERS, len(subdirs))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for subtree_files in executor.map(lambda d: self._walk(d, pattern), subdirs):
+                    files.extend(subtree_files)
 
         logger.info(f"Found {len(files)} files in {directory}")
 
@@ -74,25 +76,86 @@ class FileScanner:
             "total_files": len(files)
         }
 
-    def _get_file_info(self, file_path: str) -> Dict[str, Any]:
+    def _walk(self, directory: str, pattern: str) -> List[Dict[str, Any]]:
         """
-        Get metadata for a file.
+        Recursively collect info for files matching pattern under directory.
+
+        Like os.walk, files are listed top-down, symlinked directories are
+        not descended into, and unreadable subdirectories are skipped.
 
         Args:
-            file_path: Path to file
+            directory: Path to directory to scan
+            pattern: File pattern to match (e.g., "*.md")
+
+        Returns:
+            List of file info dicts (path, mtime, size)
+        """
+        files, subdirs = self._scan_dir(directory, pattern)
+        for subdir in subdirs:
+            files.extend(self._walk(subdir, pattern))
+        return files
+
+    def _scan_dir(self, directory: str, pattern: str) -> Tuple[List[Dict[str, Any]], List[str]]:
+        """
+        Scan a single directory level.
+
+        Uses os.scandir so file types come from the directory listing itself:
+        directories and non-matching names are filtered without a stat() call,
+        and only matching files are stat()ed.
+
+        Args:
+            directory: Path to directory to scan
+            pattern: File pattern to match (e.g., "*.md")
+
+        Returns:
+            Tuple of (file info dicts for matching files, subdirectory paths)
+        """
+        try:
+            # Drain the iterator so the directory fd is closed before recursing
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError as exc:
+            logger.warning(f"Could not scan directory {directory}: {exc}")
+            return [], []
+
+        # stat() in inode order to turn a seek storm into a linear sweep on
+        # HDD/network filesystems; inode() comes from readdir, so this is free.
+        # NT file indexes don't correlate with disk layout, so skip on Windows.
+        if SORT_BY_INODE:
+            entries.sort(key=os.DirEntry.inode)
+
+        files = []
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+            elif fnmatch.fnmatch(entry.name, pattern) and entry.is_file():
+                file_info = self._get_entry_info(entry)
+                if file_info:
+                    files.append(file_info)
+
+        return files, subdirs
+
+    def _get_entry_info(self, entry: os.DirEntry) -> Optional[Dict[str, Any]]:
+        """
+        Get metadata for a directory entry.
+
+        Args:
+            entry: Entry returned by os.scandir
 
         Returns:
             Dict containing file metadata or None if file can't be accessed
         """
         try:
-            stat = os.stat(file_path)
+            stat = entry.stat()
             return {
-                "path": file_path,
+                "path": entry.path,
                 "mtime": stat.st_mtime,
                 "size": stat.st_size
             }
-        except (OSError, IOError) as exc:
-            logger.warning(f"Could not access file {file_path}: {exc}")
+        except OSError as exc:
+            logger.warning(f"Could not access file {entry.path}: {exc}")
             return None
 
     def get_file_hash(self, file_path: str) -> str:
@@ -105,15 +168,11 @@ class FileScanner:
         Returns:
             SHA256 hash of file content
         """
-        import hashlib
-
-        sha256 = hashlib.sha256()
-
         try:
+            # file_digest reads and hashes in C (OpenSSL, SHA-NI where available)
+            # with no per-chunk Python loop
             with open(file_path, 'rb') as f:
-                while chunk := f.read(8192):
-                    sha256.update(chunk)
-            return sha256.hexdigest()
+                return hashlib.file_digest(f, "sha256").hexdigest()
         except (OSError, IOError) as exc:
             logger.error(f"Failed to hash file {file_path}: {exc}")
             raise
@@ -0,0 +1,27 @@
+"""
+Identifier utilities.
+
+Provides time-ordered UUIDv7 generation (RFC 9562) for primary keys and
+vector store IDs, so new rows land at the end of btree indexes instead of
+at random pages.
+"""
+
+import os
+import time
+import uuid
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7: 48-bit Unix millisecond timestamp followed by random bits.
+
+    Returns:
+        uuid.UUID: Time-ordered UUID (version 7, RFC 4122 variant)
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+
+    # Set version (bits 76-79) and variant (bits 62-63)
+    value = (value & ~(0xF << 76)) | (0x7 << 76)
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)
+    return uuid.UUID(int=value)
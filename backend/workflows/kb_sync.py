@@ -3,7 +3,7 @@ Knowledge base sync workflow composition.
 
 Workflow chain:
 scan_runbooks_dir → detect_changes →
-group[regenerate_embeddings tasks] → update_chromadb → invalidate_cache
+group[regenerate_embeddings_batch tasks] → update_chromadb → invalidate_cache
 
 This workflow synchronizes the knowledge base by detecting file changes,
 regenerating embeddings in parallel, updating ChromaDB, and invalidating caches.
@@ -15,9 +15,11 @@ from celery import chain, group, chord
 from backend.workflows.tasks.kb_sync_tasks import (
     scan_runbooks_dir,
     detect_changes,
-    regenerate_embeddings,
+    regenerate_embeddings_batch,
     update_chromadb,
     invalidate_cache,
+    invalidate_cache_many,
+    EMBED_BATCH_SIZE,
 )
 from backend.celery_app import app
 from backend.utils.logging import get_logger
@@ -70,11 +72,11 @@ def extract_and_process_changes(self, scan_result: Dict[str, Any]) -> Dict[str,
             "total_changes": 0
         }
 
-    # Create parallel embedding tasks for changed files
+    # Create parallel embedding tasks for batches of changed files
     if changed_files:
         embedding_tasks = group(
-            regenerate_embeddings.s(file_path)
-            for file_path in changed_files
+            regenerate_embeddings_batch.s(changed_files[start:start + EMBED_BATCH_SIZE])
+            for start in range(0, len(changed_files), EMBED_BATCH_SIZE)
         )
 
         # Create a callback task that properly handles the embeddings list
@@ -103,7 +105,7 @@ def extract_and_process_changes(self, scan_result: Dict[str, Any]) -> Dict[str,
 
         # Invalidate caches
         cache_keys = [f"runbook:{fp}" for fp in deleted_files]
-        invalidate_cache.apply_async(args=[cache_keys])
+        invalidate_cache_many(cache_keys)
 
         return {
             "status": "completed",
@@ -116,7 +118,7 @@ def extract_and_process_changes(self, scan_result: Dict[str, Any]) -> Dict[str,
 @app.task(bind=True, name="kb_sync.prepare_chromadb_update")
 def prepare_chromadb_update(
     self,
-    embeddings: List[Dict[str, Any]],
+    embedding_batches: List[List[Dict[str, Any]]],
     deleted_files: List[str],
     changed_files: List[str]
 ) -> List[str]:
@@ -125,18 +127,26 @@ def prepare_chromadb_update(
 
     This task receives embedding results from parallel tasks,
     updates ChromaDB, and returns cache keys for invalidation.
+    Files that failed to embed are logged and left out of the update.
 
     Args:
-        embeddings: List of embedding results from regenerate_embeddings
+        embedding_batches: Per-batch embedding results from regenerate_embeddings_batch
         deleted_files: List of file paths to delete
         changed_files: List of changed file paths for cache invalidation
 
     Returns:
         List of cache keys to invalidate
     """
+    results = [result for batch in embedding_batches for result in batch]
+    embeddings = [result for result in results if result.get("status") != "failed"]
+    failed = [result for result in results if result.get("status") == "failed"]
+
+    for result in failed:
+        logger.warning(f"Skipping {result['file_path']}: {result.get('error', 'embedding failed')}")
+
     logger.info(
         f"Preparing ChromaDB update with {len(embeddings)} embeddings, "
-        f"{len(deleted_files)} deletions"
+        f"{len(deleted_files)} deletions, {len(failed)} failed"
     )
 
     # Call update_chromadb synchronously
@@ -3,7 +3,7 @@ Postmortem publish workflow composition.
 
 Workflow chain:
 generate_postmortem_sections → render_jinja_template →
-group[create_github_issue + embed_in_chromadb] → notify_stakeholders
+group[create_github_issue + embed_in_chromadb] → notify_postmortem_published
 
 This workflow generates a postmortem document from a resolved incident,
 publishes it to GitHub, indexes it in ChromaDB, and notifies stakeholders.
@@ -16,7 +16,7 @@ from backend.workflows.tasks.postmortem_tasks import (
     generate_postmortem_sections,
     render_jinja_template,
     embed_in_chromadb,
-    notify_stakeholders,
+    notify_postmortem_published,
 )
 from backend.workflows.tasks.incident_tasks import create_github_issue
 from backend.utils.logging import get_logger
@@ -69,7 +69,8 @@ def create_postmortem_workflow(incident_id: str) -> chain:
                 create_github_issue.s(incident_id, f"Postmortem: Incident {incident_id[:8]}"),
                 embed_in_chromadb.s(incident_id)
             ),
-            notify_stakeholders.s(incident_id)
+            # Called as (header_results, incident_id)
+            notify_postmortem_published.s(incident_id)
         )
     )
     
@@ -11,6 +11,8 @@ from .postmortem_tasks import (
     render_jinja_template,
     embed_in_chromadb,
     notify_stakeholders,
+    notify_postmortem_published,
+    notify_stakeholders_bulk,
 )
 
 __all__ = [
@@ -23,4 +25,6 @@ __all__ = [
     "render_jinja_template",
     "embed_in_chromadb",
     "notify_stakeholders",
+    "notify_postmortem_published",
+    "notify_stakeholders_bulk",
 ]
\ No newline at end of file
@@ -9,8 +9,11 @@ This module implements the five tasks in the incident response chain:
 5. send_notification - Webhook/email to configured channels
 """
 
+import re
+import time
 import uuid
-from typing import Dict, Any, Optional, List
+from functools import lru_cache
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
 
 from celery import Task
@@ -19,13 +22,79 @@ from backend.utils.logging import get_logger, set_correlation_id, log_workflow_e
 from backend.database import SessionLocal
 from backend.models.incident import Incident, IncidentSeverity, IncidentStatus
 from backend.utils.log_parser import LogParser, LogParseError
-from backend.services.embedding_service import embedding_service
+from backend.services.embedding_service import embedding_service, SEARCH_GENERATION_KEY
+from backend.services.workflow_cache import workflow_cache
 from backend.integrations.github_client import GitHubClient, GitHubAPIError
 from backend.services.notification_service import NotificationService, NotificationError
 #from backend.utils.retry import exponential_backoff_with_jitter
 
 logger = get_logger(__name__)
 
+# Incident-specific tokens (UUIDs, IDs, counts) that shouldn't split search
+# cache entries: "timeout DB-123" and "timeout DB-456" are the same query
+_QUERY_NOISE_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|\d+"
+)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Cached runbook searches also expire on the clock, so results cannot go
+# stale indefinitely when the generation counter can't be read from Redis
+SEARCH_CACHE_TTL = 300
+
+
+def _normalize_query(error_summary: str) -> str:
+    """
+    Normalize an error summary into a runbook search query.
+
+    Args:
+        error_summary: Error summary from log analysis
+
+    Returns:
+        Lowercased query with IDs/numbers masked and whitespace collapsed
+    """
+    query = _QUERY_NOISE_RE.sub("#", error_summary.lower())
+    return _WHITESPACE_RE.sub(" ", query).strip()
+
+
+@lru_cache(maxsize=256)
+def _search_runbooks(
+    query: str,
+    limit: int,
+    generation: int,
+    ttl_bucket: int
+) -> Tuple[Tuple[str, str, float], ...]:
+    """
+    Query ChromaDB for runbooks, memoized per worker process.
+
+    Recurring error summaries skip both the query embedding and the ChromaDB
+    round-trip. generation and ttl_bucket are part of the key (and otherwise
+    unused): bumping the Redis counter after a collection write invalidates
+    entries in every worker without cross-process signalling, and a new
+    bucket every SEARCH_CACHE_TTL seconds bounds their age regardless.
+
+    Args:
+        query: Normalized search query
+        limit: Maximum number of runbooks to return
+        generation: Current value of the search generation counter
+        ttl_bucket: Current SEARCH_CACHE_TTL-sized time window
+
+    Returns:
+        Tuple of (title, category, relevance_score) per runbook
+    """
+    similar_docs = embedding_service.search_similar_documents(
+        query=query,
+        n_results=limit,
+        include_documents=False  # Only metadata and distances are used
+    )
+    return tuple(
+        (
+            doc.get("metadata", {}).get("title", "Unknown"),
+            doc.get("metadata", {}).get("category", "general"),
+            1.0 - doc.get("distance", 1.0)  # Convert distance to similarity score
+        )
+        for doc in similar_docs
+    )
+
 
 @app.task(bind=True, max_retries=0, name="workflows.create_incident_record")
 def create_incident_record(
@@ -164,21 +233,16 @@ def search_related_runbooks(
     logger.info("search_related_runbooks_started", incident_id=incident_id, query=error_summary)
 
     try:
-        # Query ChromaDB for relevant runbooks using embedding service
-        similar_docs = embedding_service.search_similar_documents(
-            query=error_summary,
-            n_results=limit
-        )
-
-        # Transform results to match expected format
-        runbooks = []
-        for doc in similar_docs:
-            metadata = doc.get("metadata", {})
-            runbooks.append({
-                "title": metadata.get("title", "Unknown"),
-                "category": metadata.get("category", "general"),
-                "relevance_score": 1.0 - doc.get("distance", 1.0)  # Convert distance to similarity score
-            })
+        # Query ChromaDB for relevant runbooks (cached per KB generation
+        # and time window)
+        generation = workflow_cache.get_value(SEARCH_GENERATION_KEY) or 0
+        ttl_bucket = int(time.monotonic() // SEARCH_CACHE_TTL)
+        runbooks = [
+            {"title": title, "category": category, "relevance_score": score}
+            for title, category, score in _search_runbooks(
+                _normalize_query(error_summary), limit, generation, ttl_bucket
+            )
+        ]
 
         result = {
             "runbooks": runbooks
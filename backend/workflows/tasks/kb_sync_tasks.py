@@ -5,23 +5,76 @@ Tasks:
 - scan_runbooks_dir: Scan runbook directory for files
 - detect_changes: Detect added/modified/deleted files
 - regenerate_embeddings: Regenerate embeddings for a file
+- regenerate_embeddings_batch: Regenerate embeddings for a batch of files
 - update_chromadb: Batch update ChromaDB with changes
 - invalidate_cache: Invalidate caches for updated files
+
+Helpers:
+- invalidate_cache_many: Enqueue invalidate_cache over batches of keys
 """
 
-from typing import Dict, Any, List
-from datetime import datetime
-from celery import Task
+import mmap
+import os
+from functools import lru_cache
+from pathlib import PurePath
+from typing import Dict, Any, List, Tuple
+from datetime import datetime, timezone
+from celery import Task, group
+from celery.result import GroupResult
 
 from backend.celery_app import app
 from backend.utils.file_scanner import file_scanner
 from backend.services.sync_service import sync_service
-from backend.services.embedding_service import embedding_service
-from backend.services.workflow_cache import WorkflowCache
+from backend.services.embedding_service import embedding_service, SEARCH_GENERATION_KEY
+from backend.services.workflow_cache import workflow_cache
 from backend.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Number of cache keys handled by a single invalidate_cache task
+INVALIDATE_CHUNK_SIZE = 200
+
+# Number of files embedded by a single regenerate_embeddings_batch task
+EMBED_BATCH_SIZE = 32
+
+
+@lru_cache(maxsize=4096)
+def _file_meta(file_path: str) -> Tuple[str, str]:
+    """
+    Split a runbook path into the name and extension stored as metadata.
+
+    Cached because periodic syncs re-embed the same runbook paths.
+
+    Args:
+        file_path: Path to runbook file
+
+    Returns:
+        Tuple of (file name, extension without the dot)
+    """
+    path = PurePath(file_path)
+    return path.name, path.suffix.lstrip(".")
+
+
+def _read_document(file_path: str) -> str:
+    """
+    Read a runbook file through a read-only memory map.
+
+    Decoding straight from the mapped pages skips the intermediate bytes
+    copy of a buffered read, and the pages are shared through the kernel
+    page cache across worker processes.
+
+    Args:
+        file_path: Path to runbook file
+
+    Returns:
+        Decoded file content ("" for empty files, which cannot be mapped)
+    """
+    with open(file_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, 'utf-8')
+
 
 @app.task(
     bind=True,
@@ -57,7 +110,8 @@ def scan_runbooks_dir(self: Task, runbooks_dir: str) -> Dict[str, Any]:
         result = {
             "files": scan_result["files"],
             "total_files": scan_result["total_files"],
-            "scan_timestamp": datetime.now().isoformat() + "Z"
+            # Taken once per scan, in UTC so the "Z" suffix is accurate
+            "scan_timestamp": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         }
 
         logger.info(
@@ -114,7 +168,13 @@ def detect_changes(self: Task, current_files: List[Dict[str, Any]]) -> Dict[str,
 
 @app.task(
     bind=True,
+    autoretry_for=(Exception,),
+    dont_autoretry_for=(FileNotFoundError,),
     max_retries=3,
+    retry_backoff=10,
+    retry_backoff_max=3600,
+    retry_jitter=True,
+    acks_late=True,
     name="kb_sync.regenerate_embeddings"
 )
 def regenerate_embeddings(self: Task, file_path: str) -> Dict[str, Any]:
@@ -139,12 +199,13 @@ def regenerate_embeddings(self: Task, file_path: str) -> Dict[str, Any]:
 
     try:
         # Read file content
-        with open(file_path, 'r', encoding='utf-8') as f:
-            document = f.read()
+        document = _read_document(file_path)
 
         if not document.strip():
             raise ValueError(f"File is empty: {file_path}")
 
+        file_name, file_type = _file_meta(file_path)
+
         # Generate embedding using embedding service
         # For runbooks, use "runbooks" collection
         embedding_result = embedding_service.embed_document(
@@ -153,10 +214,15 @@ def regenerate_embeddings(self: Task, file_path: str) -> Dict[str, Any]:
             metadata={
                 "document_type": "runbook",
                 "file_path": file_path,
+                "file_name": file_name,
+                "file_type": file_type,
                 "indexed_at": datetime.now().isoformat()
             }
         )
 
+        # Runbook search results cached by workers are now stale
+        workflow_cache.incr(SEARCH_GENERATION_KEY)
+
         result = {
             "file_path": file_path,
             "embedding_id": embedding_result["embedding_id"],
@@ -175,7 +241,110 @@ def regenerate_embeddings(self: Task, file_path: str) -> Dict[str, Any]:
         raise
     except Exception as exc:
         logger.error(f"Failed to regenerate embeddings for {file_path}: {exc}")
-        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+        raise  # Retried with exponential backoff via autoretry_for
+
+
+@app.task(
+    bind=True,
+    autoretry_for=(Exception,),
+    max_retries=3,
+    retry_backoff=10,
+    retry_backoff_max=3600,
+    retry_jitter=True,
+    acks_late=True,
+    name="kb_sync.regenerate_embeddings_batch"
+)
+def regenerate_embeddings_batch(self: Task, file_paths: List[str]) -> List[Dict[str, Any]]:
+    """
+    Regenerate embeddings for a batch of runbook files.
+
+    All files are embedded with a single embedding service call, so the
+    embedding model encodes every chunk of the batch in one pass.
+
+    Args:
+        file_paths: Paths to runbook files (typically EMBED_BATCH_SIZE of them)
+
+    Returns:
+        List of dicts, one per file, in input order:
+        - file_path: File path
+        - embedding_id: UUID of the embedding (None if failed)
+        - chunks: Number of chunks created
+        - status: "embedded" or "failed"
+        - error: Why the file was not embedded (only when status is "failed")
+
+    Raises:
+        Exception: If embedding fails (will retry)
+    """
+    logger.info(f"Regenerating embeddings for batch of {len(file_paths)} files")
+
+    documents = []
+    failed = {}
+
+    # Missing or empty files are reported per file instead of failing the batch
+    for file_path in file_paths:
+        try:
+            document = _read_document(file_path)
+        except FileNotFoundError:
+            logger.error(f"File not found: {file_path}")
+            failed[file_path] = "file not found"
+            continue
+
+        if not document.strip():
+            logger.warning(f"File is empty: {file_path}")
+            failed[file_path] = "file is empty"
+            continue
+
+        file_name, file_type = _file_meta(file_path)
+        documents.append({
+            "incident_id": file_path,  # Use file path as ID for runbooks
+            "document": document,
+            "metadata": {
+                "document_type": "runbook",
+                "file_path": file_path,
+                "file_name": file_name,
+                "file_type": file_type,
+                "indexed_at": datetime.now().isoformat()
+            }
+        })
+
+    try:
+        embedding_results = embedding_service.embed_batch(documents)
+    except Exception as exc:
+        logger.error(f"Failed to regenerate embeddings for batch: {exc}")
+        raise  # Retried with exponential backoff via autoretry_for
+
+    if embedding_results:
+        # Runbook search results cached by workers are now stale
+        workflow_cache.incr(SEARCH_GENERATION_KEY)
+
+    embedded = {
+        doc["incident_id"]: embedding_result
+        for doc, embedding_result in zip(documents, embedding_results)
+    }
+
+    results = []
+    for file_path in file_paths:
+        if file_path in embedded:
+            results.append({
+                "file_path": file_path,
+                "embedding_id": embedded[file_path]["embedding_id"],
+                "chunks": embedded[file_path].get("chunks", 1),
+                "status": "embedded"
+            })
+        else:
+            results.append({
+                "file_path": file_path,
+                "embedding_id": None,
+                "chunks": 0,
+                "status": "failed",
+                "error": failed[file_path]
+            })
+
+    logger.info(
+        f"Batch embedding complete: {len(embedded)} embedded, "
+        f"{len(failed)} failed"
+    )
+    return results
 
 
 @app.task(
@@ -217,6 +386,9 @@ def update_chromadb(
             deleted_files=deleted_files
         )
 
+        # Runbook search results cached by workers are now stale
+        workflow_cache.incr(SEARCH_GENERATION_KEY)
+
         logger.info(
             f"ChromaDB update complete: {result['updated_count']} updated, "
             f"{result['deleted_count']} deleted"
@@ -230,7 +402,12 @@ def update_chromadb(
 
 @app.task(
     bind=True,
+    autoretry_for=(Exception,),
     max_retries=3,
+    retry_backoff=10,
+    retry_backoff_max=3600,
+    retry_jitter=True,
+    acks_late=True,
     name="kb_sync.invalidate_cache"
 )
 def invalidate_cache(self: Task, cache_keys: List[str]) -> Dict[str, Any]:
@@ -252,12 +429,40 @@ def invalidate_cache(self: Task, cache_keys: List[str]) -> Dict[str, Any]:
 
     try:
         # Invalidate cache using workflow cache
-        cache = WorkflowCache()
-        result = cache.invalidate_keys(cache_keys)
+        result = workflow_cache.invalidate_keys(cache_keys)
 
         logger.info(f"Cache invalidation complete: {result['invalidated_keys']} keys")
         return result
 
     except Exception as exc:
         logger.error(f"Failed to invalidate cache: {exc}")
-        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+        raise  # Retried with exponential backoff via autoretry_for
+
+
+def invalidate_cache_many(
+    cache_keys: List[str],
+    chunk_size: int = INVALIDATE_CHUNK_SIZE
+) -> GroupResult:
+    """
+    Enqueue cache invalidation for a large set of keys.
+
+    Keys are split into batches of ``chunk_size`` and published as a single
+    group, so the broker sees one message per batch (sent over one producer
+    connection) instead of one message per key.
+
+    Args:
+        cache_keys: List of cache keys or patterns to invalidate
+        chunk_size: Maximum number of keys per invalidate_cache task
+
+    Returns:
+        GroupResult for the enqueued invalidate_cache tasks
+    """
+    batches = [
+        cache_keys[start:start + chunk_size]
+        for start in range(0, len(cache_keys), chunk_size)
+    ]
+    logger.info(
+        f"Enqueuing invalidation of {len(cache_keys)} cache keys "
+        f"in {len(batches)} batches"
+    )
+    return group([invalidate_cache.s(batch) for batch in batches]).apply_async()
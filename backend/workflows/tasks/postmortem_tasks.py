@@ -6,25 +6,107 @@ Tasks:
 - render_jinja_template: Render postmortem template with sections
 - embed_in_chromadb: Embed postmortem document in ChromaDB
 - notify_stakeholders: Send notifications about postmortem completion
+- notify_postmortem_published: Publish workflow callback for notify_stakeholders
+- notify_stakeholders_bulk: Send notifications for many postmortems at once
 """
 
 from typing import Dict, Any, List
+import hashlib
 import uuid
 from datetime import datetime
+import orjson
 from celery import Task
+from pydantic import BaseModel, HttpUrl, TypeAdapter
 
 from backend.celery_app import app
 from backend.database import get_db
 from backend.models.incident import Incident
 from backend.integrations.claude_client import claude_client
 from backend.services.template_service import template_service
-from backend.services.embedding_service import embedding_service
+from backend.services.embedding_service import embedding_service, SEARCH_GENERATION_KEY
 #from backend.services.notification_service import notification_service
+from backend.services.notification_service import NotificationService
+from backend.services.workflow_cache import workflow_cache, TAG_PREFIX
 from backend.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+class PostmortemNotification(BaseModel):
+    """Schema of the postmortem data passed to notify_stakeholders."""
+    github_url: HttpUrl
+    summary: str
+
+
+# Built once at import so each notification reuses the compiled validator
+_POSTMORTEM_NOTIFICATION_ADAPTER = TypeAdapter(PostmortemNotification)
+
+# Rendered postmortems are memoized under a hash of their template context
+RENDER_CACHE_PREFIX = "pm:render:"
+RENDER_CACHE_TTL = 3600
+
+# Renders are tagged per incident so a new render can evict the old ones
+RENDER_CACHE_TAG_PREFIX = "postmortem:"
+
+
+def _render_cache_key(template_context: Dict[str, Any]) -> str:
+    """
+    Build the render cache key from a canonical hash of the template context.
+
+    generated_at is excluded so re-rendering unchanged content hits the
+    cache. Incident fields are included, so editing the incident misses it.
+
+    Args:
+        template_context: Context passed to template_service.render_postmortem
+
+    Returns:
+        Cache key ("pm:render:<blake2b-128 hex digest>")
+    """
+    canonical = {k: v for k, v in template_context.items() if k != "generated_at"}
+    digest = hashlib.blake2b(
+        orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS, default=str),
+        digest_size=16
+    ).hexdigest()
+    return f"{RENDER_CACHE_PREFIX}{digest}"
+
+
+def _postmortem_notification(
+    incident_id: str,
+    data: PostmortemNotification
+) -> Dict[str, Any]:
+    """
+    Build the message and metadata sent for a published postmortem.
+
+    Args:
+        incident_id: UUID of the incident
+        data: Validated postmortem notification data
+
+    Returns:
+        Dict with "message" and "metadata", as taken by NotificationService
+    """
+    return {
+        "message": f"Postmortem published for incident {incident_id}: {data.summary}",
+        "metadata": {
+            "incident_id": incident_id,
+            "github_url": str(data.github_url),
+            "notification_type": "postmortem_published"
+        }
+    }
+
+
+def _notification_skipped(reason: str = "NOTIFICATION_WEBHOOK_URL not configured") -> Dict[str, Any]:
+    """
+    Build the result returned when a postmortem notification is not sent.
+
+    Args:
+        reason: Why the notification was skipped
+
+    Returns:
+        Dict shaped as a NotificationService result with status "skipped"
+    """
+    return {"sent_to": [], "failed": [], "status": "skipped", "reason": reason}
+
+
 @app.task(
     bind=True,
     max_retries=3,
@@ -174,14 +256,28 @@ def render_jinja_template(
             "status": "Published"
         }
 
+        # Reuse the previous render when the content is unchanged
+        cache_key = _render_cache_key(template_context)
+        cached = workflow_cache.get_value(cache_key)
+        if cached is not None:
+            logger.info(f"Reusing cached postmortem render for incident {incident_id}")
+            return cached
+
         # Render template
         rendered_document = template_service.render_postmortem(template_context)
         #print(f"render_jinja_template Rendered document: {rendered_document}")
         logger.info(f"Successfully rendered postmortem for incident {incident_id}")
-        return {
+        result = {
             "rendered_document": rendered_document,
             "format": "markdown"
         }
+        # Renders of this incident's earlier content are now superseded
+        render_tag = f"{RENDER_CACHE_TAG_PREFIX}{incident_id}"
+        workflow_cache.invalidate_keys([f"{TAG_PREFIX}{render_tag}"])
+        workflow_cache.set_tagged(
+            cache_key, result, tags=[render_tag], ttl_seconds=RENDER_CACHE_TTL
+        )
+        return result
 
     finally:
         db.close()
@@ -234,6 +330,9 @@ def embed_in_chromadb(
             }
         )
 
+        # Searches cached by workers don't include this postmortem yet
+        workflow_cache.incr(SEARCH_GENERATION_KEY)
+
         logger.info(f"Successfully embedded postmortem for incident {incident_id}")
         return result
 
@@ -245,7 +344,13 @@ def embed_in_chromadb(
 
 @app.task(
     bind=True,
+    autoretry_for=(Exception,),
     max_retries=3,
+    retry_backoff=10,
+    retry_backoff_max=3600,
+    retry_jitter=True,
+    dont_autoretry_for=(ValueError,),
+    acks_late=True,
     name="postmortem.notify_stakeholders"
 )
 def notify_stakeholders(
@@ -265,40 +370,149 @@ def notify_stakeholders(
     Returns:
         Dict containing:
         - sent_to: List of channels where notifications were sent
-        - status: "success", "partial", or "failed"
-        - recipients: Number of recipients notified
+        - failed: List of channels that failed
+        - status: "success", "partial", or "skipped" if no webhook is configured
 
     Raises:
-        ValueError: If required fields are missing
-        KeyError: If github_url is missing
-        Exception: If notification service fails (will retry)
+        ValueError: If required fields are missing or invalid (not retried)
+        NotificationError: If every channel fails (will retry)
     """
     logger.info(f"Notifying stakeholders about postmortem for incident {incident_id}")
 
-    print(f"Postmortem data: {postmortem_data} ++++++++++++++")
-    # Validate required fields
-    #TODO RBM
-    '''
-    if "github_url" not in postmortem_data:
-        raise ValueError("Missing required field: github_url")
-    if "summary" not in postmortem_data:
-        raise ValueError("Missing required field: summary")
-    '''
+    # Validate required fields (pydantic ValidationError is a ValueError)
+    validated = _POSTMORTEM_NOTIFICATION_ADAPTER.validate_python(postmortem_data)
 
-    try:
-        # Send notifications
-        notification_payload = {
-            "incident_id": incident_id,
-            #"github_url": postmortem_data["github_url"],
-            #"summary": postmortem_data["summary"],
-            "notification_type": "postmortem_published"
-        }
+    notification_service = NotificationService()
+    if not notification_service.webhook_enabled:
+        logger.warning(f"NOTIFICATION_WEBHOOK_URL not configured, skipping notification for incident {incident_id}")
+        return _notification_skipped()
 
-        result = notification_payload#None#TODO RBM notification_service.send_notification(notification_payload)
+    try:
+        # Same delivery path as notify_stakeholders_bulk
+        result = notification_service.send(**_postmortem_notification(incident_id, validated))
 
         logger.info(f"Successfully notified stakeholders for incident {incident_id}")
         return result
 
     except Exception as exc:
         logger.error(f"Notification failed for incident {incident_id}: {exc}")
-        raise self.retry(exc=exc, countdown=2 ** self.request.retries)
+        raise  # Retried with exponential backoff via autoretry_for
+
+
+@app.task(
+    bind=True,
+    autoretry_for=(Exception,),
+    max_retries=3,
+    retry_backoff=10,
+    retry_backoff_max=3600,
+    retry_jitter=True,
+    dont_autoretry_for=(ValueError,),
+    acks_late=True,
+    name="postmortem.notify_published"
+)
+def notify_postmortem_published(
+    self: Task,
+    header_results: List[Dict[str, Any]],
+    incident_id: str
+) -> Dict[str, Any]:
+    """
+    Notify stakeholders once a postmortem has been published.
+
+    Chord callback of the publish workflow: Celery passes the header results
+    first, so this adapts them into the postmortem_data notify_stakeholders
+    expects and runs it in-process.
+
+    Args:
+        header_results: [create_github_issue result, embed_in_chromadb result]
+        incident_id: UUID of the incident
+
+    Returns:
+        Dict shaped as the notify_stakeholders result, or with status
+        "skipped" and a reason if no GitHub issue was created
+
+    Raises:
+        NotificationError: If every channel fails (will retry)
+    """
+    github_result = header_results[0]
+
+    if github_result.get("skipped") or not github_result.get("issue_url"):
+        logger.info(f"No GitHub issue for incident {incident_id}, skipping stakeholder notification")
+        return _notification_skipped(github_result.get("reason", "No GitHub issue created"))
+
+    postmortem_data = {
+        "github_url": github_result["issue_url"],
+        "summary": f"Postmortem published as GitHub issue #{github_result['issue_number']}"
+    }
+    return notify_stakeholders(incident_id, postmortem_data)
+
+
+@app.task(
+    bind=True,
+    autoretry_for=(Exception,),
+    max_retries=3,
+    retry_backoff=10,
+    retry_backoff_max=3600,
+    retry_jitter=True,
+    dont_autoretry_for=(ValueError,),
+    acks_late=True,
+    name="postmortem.notify_stakeholders_bulk"
+)
+def notify_stakeholders_bulk(
+    self: Task,
+    incident_postmortem_pairs: List[List[Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Notify stakeholders about many postmortems in one task.
+
+    All notifications are sent concurrently over a single HTTP connection
+    pool instead of one notify_stakeholders task (and worker slot) each.
+
+    Args:
+        incident_postmortem_pairs: List of [incident_id, postmortem_data]
+            pairs, with postmortem_data shaped as for notify_stakeholders
+
+    Returns:
+        List of dicts, in input order, containing:
+        - incident_id: UUID of the incident
+        - sent_to: List of channels where notifications were sent
+        - failed: List of channels that failed
+        - status: "success", "partial", "failed", or "skipped" if no
+          webhook is configured
+
+    Raises:
+        ValueError: If any postmortem_data is missing or has invalid fields
+            (not retried)
+        Exception: If the bulk send itself fails (will retry). Per-postmortem
+            delivery failures are reported in the results rather than raised,
+            so one bad delivery doesn't resend the whole batch.
+    """
+    logger.info(f"Bulk notifying stakeholders for {len(incident_postmortem_pairs)} postmortems")
+
+    # Validate everything up front so a bad entry fails before anything is sent
+    validated = [
+        (incident_id, _POSTMORTEM_NOTIFICATION_ADAPTER.validate_python(postmortem_data))
+        for incident_id, postmortem_data in incident_postmortem_pairs
+    ]
+
+    notifications = [
+        _postmortem_notification(incident_id, data)
+        for incident_id, data in validated
+    ]
+
+    notification_service = NotificationService()
+    if not notification_service.webhook_enabled:
+        logger.warning(
+            f"NOTIFICATION_WEBHOOK_URL not configured, skipping notifications for {len(validated)} postmortems"
+        )
+        return [{"incident_id": incident_id, **_notification_skipped()} for incident_id, _ in validated]
+
+    results = notification_service.send_bulk(notifications)
+
+    failed_count = sum(1 for result in results if result["status"] == "failed")
+    logger.info(
+        f"Bulk notified stakeholders for {len(results) - failed_count}/{len(results)} postmortems"
+    )
+    return [
+        {"incident_id": incident_id, **result}
+        for (incident_id, _), result in zip(validated, results)
+    ]
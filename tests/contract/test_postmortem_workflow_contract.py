@@ -10,7 +10,7 @@ TDD: This test should FAIL initially before implementation.
 
 import pytest
 import uuid
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 from celery import chain, group
 
 # These imports will fail until implementation exists - that's expected for TDD
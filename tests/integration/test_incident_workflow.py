@@ -9,7 +9,7 @@ TDD: This test should FAIL initially before full implementation.
 
 import pytest
 import uuid
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 
 try:
     from backend.workflows.incident_response import create_incident_workflow
@@ -10,12 +10,12 @@ TDD: This test should FAIL initially before implementation.
 
 import pytest
 import uuid
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
 from datetime import datetime
 
 # These imports will fail until implementation exists - that's expected for TDD
 try:
-    from backend.workflows.kb_sync import create_kb_sync_workflow
+    from backend.workflows.kb_sync import create_kb_sync_workflow, prepare_chromadb_update
 except ImportError:
     pytest.skip("Implementation not yet complete", allow_module_level=True)
 
@@ -56,13 +56,16 @@ class TestKBSyncWorkflowIntegration:
             "total_changes": 3
         }
 
-        # Mock embeddings
-        mock_embedding.embed_document.return_value = {
-            "embedding_id": str(uuid.uuid4()),
-            "collection": "runbooks",
-            "status": "embedded",
-            "chunks": 2
-        }
+        # Mock embeddings (one batch call covers all changed files)
+        mock_embedding.embed_batch.return_value = [
+            {
+                "embedding_id": str(uuid.uuid4()),
+                "collection": "runbooks",
+                "status": "embedded",
+                "chunks": 2
+            }
+            for _ in range(2)
+        ]
 
         # Mock batch update
         mock_embedding.batch_update.return_value = {
@@ -86,7 +89,7 @@ class TestKBSyncWorkflowIntegration:
         # Verify all workflow steps executed
         mock_scanner.scan_directory.assert_called_once()
         mock_sync.detect_changes.assert_called_once()
-        mock_embedding.embed_document.assert_called()
+        mock_embedding.embed_batch.assert_called_once()
         mock_embedding.batch_update.assert_called_once()
         mock_cache.invalidate_keys.assert_called_once()
 
@@ -163,12 +166,15 @@ class TestKBSyncWorkflowIntegration:
             "total_changes": 5
         }
 
-        mock_embedding.embed_document.return_value = {
-            "embedding_id": str(uuid.uuid4()),
-            "collection": "runbooks",
-            "status": "embedded",
-            "chunks": 1
-        }
+        mock_embedding.embed_batch.side_effect = lambda documents: [
+            {
+                "embedding_id": str(uuid.uuid4()),
+                "collection": "runbooks",
+                "status": "embedded",
+                "chunks": 1
+            }
+            for _ in documents
+        ]
 
         mock_embedding.batch_update.return_value = {
             "updated_count": 5,
@@ -181,8 +187,8 @@ class TestKBSyncWorkflowIntegration:
         result = workflow.apply_async().get(timeout=10)
 
         # Assert
-        # All 5 files should be embedded (possibly in parallel)
-        assert mock_embedding.embed_document.call_count == 5
+        # All 5 files fit in one batch, embedded with a single call
+        mock_embedding.embed_batch.assert_called_once()
 
     @patch('backend.workflows.tasks.kb_sync_tasks.file_scanner')
     @patch('backend.workflows.tasks.kb_sync_tasks.sync_service')
@@ -260,12 +266,15 @@ class TestKBSyncWorkflowIntegration:
         }
         mock_sync.detect_changes.return_value = changes
 
-        mock_embedding.embed_document.return_value = {
-            "embedding_id": str(uuid.uuid4()),
-            "collection": "runbooks",
-            "status": "embedded",
-            "chunks": 1
-        }
+        mock_embedding.embed_batch.side_effect = lambda documents: [
+            {
+                "embedding_id": str(uuid.uuid4()),
+                "collection": "runbooks",
+                "status": "embedded",
+                "chunks": 1
+            }
+            for _ in documents
+        ]
 
         mock_embedding.batch_update.return_value = {
             "updated_count": 2,
@@ -290,8 +299,8 @@ class TestKBSyncWorkflowIntegration:
         # 2. Changes detected
         mock_sync.detect_changes.assert_called_once()
 
-        # 3. Embeddings generated for changed files
-        assert mock_embedding.embed_document.call_count == 2
+        # 3. Embeddings generated for changed files in one batch
+        mock_embedding.embed_batch.assert_called_once()
 
         # 4. ChromaDB updated
         mock_embedding.batch_update.assert_called_once()
@@ -329,12 +338,15 @@ class TestKBSyncWorkflowIntegration:
             "total_changes": 2
         }
 
-        mock_embedding.embed_document.return_value = {
-            "embedding_id": str(uuid.uuid4()),
-            "collection": "runbooks",
-            "status": "embedded",
-            "chunks": 1
-        }
+        mock_embedding.embed_batch.side_effect = lambda documents: [
+            {
+                "embedding_id": str(uuid.uuid4()),
+                "collection": "runbooks",
+                "status": "embedded",
+                "chunks": 1
+            }
+            for _ in documents
+        ]
 
         mock_embedding.batch_update.return_value = {
             "updated_count": 2,
@@ -347,6 +359,36 @@ class TestKBSyncWorkflowIntegration:
         result = workflow.apply_async().get(timeout=10)
 
         # Assert
-        # All files should be embedded on first run
-        assert mock_embedding.embed_document.call_count == 2
+        # All files should be embedded on first run, in one batch
+        mock_embedding.embed_batch.assert_called_once()
         assert result is not None
+
+    @patch('backend.workflows.kb_sync.update_chromadb')
+    def test_kb_sync_workflow_skips_failed_embeddings(self, mock_update):
+        """Test that files which failed to embed are not sent to ChromaDB."""
+        # Arrange
+        embedded = {
+            "file_path": "/runbooks/a.md",
+            "embedding_id": str(uuid.uuid4()),
+            "chunks": 3,
+            "status": "embedded"
+        }
+        missing = {
+            "file_path": "/runbooks/b.md",
+            "embedding_id": None,
+            "chunks": 0,
+            "status": "failed",
+            "error": "file not found"
+        }
+        mock_update.apply_async.return_value.get.return_value = {"updated_count": 1, "deleted_count": 0}
+
+        # Act
+        cache_keys = prepare_chromadb_update(
+            [[embedded, missing]],
+            [],
+            ["/runbooks/a.md", "/runbooks/b.md"]
+        )
+
+        # Assert
+        mock_update.apply_async.assert_called_once_with(args=[[embedded], []])
+        assert cache_keys == ["runbook:/runbooks/a.md", "runbook:/runbooks/b.md"]
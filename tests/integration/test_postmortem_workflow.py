@@ -3,14 +3,14 @@ Integration test for full postmortem publish workflow.
 
 Tests the complete workflow chain:
 generate_postmortem_sections → render_jinja_template →
-group[create_github_issue + embed_in_chromadb] → notify_stakeholders
+group[create_github_issue + embed_in_chromadb] → notify_postmortem_published
 
 TDD: This test should FAIL initially before implementation.
 """
 
 import pytest
 import uuid
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch
 from datetime import datetime, timedelta
 
 # These imports will fail until implementation exists - that's expected for TDD
@@ -351,3 +351,44 @@ class TestPostmortemWorkflowIntegration:
         mock_notification.send_notification.assert_called_once()
         notify_call_args = mock_notification.send_notification.call_args
         assert github_url in str(notify_call_args) or incident_id in str(notify_call_args)
+
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_postmortem_workflow_notify_callback_args(self, mock_notification_service_class):
+        """Test that the chord callback accepts the header results Celery passes it."""
+        # Arrange
+        incident_id = str(uuid.uuid4())
+        header_results = [
+            {"issue_url": "https://github.com/org/repo/issues/456", "issue_number": 456, "skipped": False},
+            {"embedding_id": str(uuid.uuid4()), "collection": "postmortems", "status": "indexed"}
+        ]
+        mock_service = mock_notification_service_class.return_value
+        mock_service.send.return_value = {"sent_to": ["webhook"], "failed": [], "status": "success"}
+        callback = create_postmortem_workflow(incident_id=incident_id).tasks[-1].body
+
+        # Act: a chord calls its body with the header results prepended
+        result = callback.clone(args=(header_results,)).apply().get()
+
+        # Assert
+        assert result["status"] == "success"
+        mock_service.send.assert_called_once()
+        metadata = mock_service.send.call_args.kwargs["metadata"]
+        assert metadata["incident_id"] == incident_id
+        assert metadata["github_url"] == "https://github.com/org/repo/issues/456"
+
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_postmortem_workflow_notify_skipped_without_issue(self, mock_notification_service_class):
+        """Test that the callback skips notifying when GitHub issue creation was skipped."""
+        # Arrange
+        incident_id = str(uuid.uuid4())
+        header_results = [
+            {"skipped": True, "reason": "GitHub integration is disabled"},
+            {"embedding_id": str(uuid.uuid4()), "collection": "postmortems", "status": "indexed"}
+        ]
+        callback = create_postmortem_workflow(incident_id=incident_id).tasks[-1].body
+
+        # Act
+        result = callback.clone(args=(header_results,)).apply().get()
+
+        # Assert
+        assert result["status"] == "skipped"
+        mock_notification_service_class.return_value.send.assert_not_called()
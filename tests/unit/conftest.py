@@ -0,0 +1,57 @@
+"""
+Shared fixtures for unit tests.
+
+Service stand-ins are built with Mock(spec=...) rather than the bare
+MagicMock @patch creates: attributes the real class doesn't have raise
+AttributeError, so tests break when a service API is renamed, and no
+magic-method machinery is set up per access.
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+
+
+@pytest.fixture
+def mock_workflow_cache():
+    """WorkflowCache stand-in patched over the shared cache and kb_sync_tasks' reference to it."""
+    kb_sync_tasks = pytest.importorskip(
+        "backend.workflows.tasks.kb_sync_tasks",
+        reason="Implementation not yet complete"
+    )
+    workflow_cache = pytest.importorskip(
+        "backend.services.workflow_cache",
+        reason="Implementation not yet complete"
+    )
+    cache = Mock(spec=workflow_cache.WorkflowCache)
+    with patch.object(kb_sync_tasks, "workflow_cache", cache), \
+            patch.object(workflow_cache, "workflow_cache", cache):
+        yield cache
+
+
+@pytest.fixture
+def mock_postmortem_cache():
+    """WorkflowCache stand-in patched over postmortem_tasks.workflow_cache; lookups miss."""
+    postmortem_tasks = pytest.importorskip(
+        "backend.workflows.tasks.postmortem_tasks",
+        reason="Implementation not yet complete"
+    )
+    workflow_cache = pytest.importorskip(
+        "backend.services.workflow_cache",
+        reason="Implementation not yet complete"
+    )
+    cache = Mock(spec=workflow_cache.WorkflowCache)
+    cache.get_value.return_value = None
+    with patch.object(postmortem_tasks, "workflow_cache", cache):
+        yield cache
+
+
+@pytest.fixture
+def mock_notification_service():
+    """NotificationService instance returned by incident_tasks.NotificationService()."""
+    incident_tasks = pytest.importorskip(
+        "backend.workflows.tasks.incident_tasks",
+        reason="Implementation not yet complete"
+    )
+    service = Mock(spec=incident_tasks.NotificationService)
+    with patch.object(incident_tasks, "NotificationService", return_value=service):
+        yield service
@@ -5,12 +5,10 @@ TDD: This test should FAIL initially before full implementation.
 """
 
 import pytest
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import patch, mock_open
 
-try:
-    from backend.workflows.tasks.incident_tasks import analyze_logs_async
-except ImportError:
-    pytest.skip("Implementation not yet complete", allow_module_level=True)
+incident_tasks = pytest.importorskip("backend.workflows.tasks.incident_tasks", reason="Implementation not yet complete")
+analyze_logs_async = incident_tasks.analyze_logs_async
 
 
 class TestAnalyzeLogsAsync:
@@ -0,0 +1,70 @@
+"""
+Unit test for the CachedPath stat cache.
+
+Tests that os.path-style predicates are answered from a single stat().
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from backend.utils.cachedpath import CachedPath
+
+
+class TestCachedPath:
+    """Unit tests for CachedPath."""
+
+    def test_predicates_share_one_stat(self, tmp_path):
+        """Test that repeated checks on a path stat it only once."""
+        # Arrange
+        cpath = CachedPath()
+
+        # Act
+        with patch("backend.utils.cachedpath.os.stat", wraps=os.stat) as mock_stat:
+            assert cpath.exists(str(tmp_path))
+            assert cpath.isdir(str(tmp_path))
+            assert not cpath.isfile(str(tmp_path))
+
+        # Assert
+        assert mock_stat.call_count == 1
+
+    def test_missing_path_is_cached(self, tmp_path):
+        """Test that missing paths report False without raising."""
+        # Arrange
+        cpath = CachedPath()
+        missing = str(tmp_path / "missing.md")
+
+        # Act & Assert
+        assert not cpath.exists(missing)
+        assert not cpath.isfile(missing)
+        assert cpath.stat(missing) is None
+
+    def test_updatecache_after_write(self, tmp_path):
+        """Test that invalidating a path picks up a newly written file."""
+        # Arrange
+        cpath = CachedPath()
+        path = tmp_path / "runbook.md"
+        assert not cpath.exists(str(path))
+
+        # Act
+        path.write_text("# Runbook")
+        cpath.updatecache(str(path))
+
+        # Assert
+        assert cpath.isfile(str(path))
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="Symlinks not supported")
+    def test_islink(self, tmp_path):
+        """Test that symlinks are detected via lstat and followed by stat."""
+        # Arrange
+        target = tmp_path / "target.md"
+        target.write_text("# Target")
+        link = tmp_path / "link.md"
+        os.symlink(target, link)
+        cpath = CachedPath()
+
+        # Act & Assert
+        assert cpath.islink(str(link))
+        assert not cpath.islink(str(target))
+        assert cpath.isfile(str(link))
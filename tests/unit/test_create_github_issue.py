@@ -5,12 +5,10 @@ TDD: This test should FAIL initially before full implementation.
 """
 
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
-try:
-    from backend.workflows.tasks.incident_tasks import create_github_issue
-except ImportError:
-    pytest.skip("Implementation not yet complete", allow_module_level=True)
+incident_tasks = pytest.importorskip("backend.workflows.tasks.incident_tasks", reason="Implementation not yet complete")
+create_github_issue = incident_tasks.create_github_issue
 
 
 class TestCreateGitHubIssue:
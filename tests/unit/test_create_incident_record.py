@@ -9,10 +9,8 @@ import uuid
 from unittest.mock import Mock, patch
 from datetime import datetime
 
-try:
-    from backend.workflows.tasks.incident_tasks import create_incident_record
-except ImportError:
-    pytest.skip("Implementation not yet complete", allow_module_level=True)
+incident_tasks = pytest.importorskip("backend.workflows.tasks.incident_tasks", reason="Implementation not yet complete")
+create_incident_record = incident_tasks.create_incident_record
 
 
 class TestCreateIncidentRecord:
@@ -6,15 +6,25 @@ Tests the task that embeds postmortem documents in ChromaDB for searchability.
 TDD: This test should FAIL initially before implementation.
 """
 
+import re
 import pytest
 import uuid
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
 
 # These imports will fail until implementation exists - that's expected for TDD
-try:
-    from backend.workflows.tasks.postmortem_tasks import embed_in_chromadb
-except ImportError:
-    pytest.skip("Implementation not yet complete", allow_module_level=True)
+postmortem_tasks = pytest.importorskip("backend.workflows.tasks.postmortem_tasks", reason="Implementation not yet complete")
+embed_in_chromadb = postmortem_tasks.embed_in_chromadb
+
+# Keep the search generation bump off Redis
+pytestmark = pytest.mark.usefixtures("mock_postmortem_cache")
+
+_RE_EMPTY = re.compile(r"empty|document")
+_RE_CHROMADB = re.compile(r"ChromaDB connection error")
+
+_FIXED_EMBEDDING_ID = "3f2b8c4e-9a1d-4e6f-8b7a-2c5d9e0f1a3b"
+
+# Built once at import; the task only forwards it to the (mocked) embedding service
+_LARGE_DOCUMENT = "# Postmortem\n\n" + ("This is a test paragraph. " * 1000)
 
 
 class TestEmbedInChromaDB:
@@ -75,9 +85,9 @@ Database connection pool exhaustion.
 
         # Assert
         mock_embedding_service.embed_document.assert_called_once()
-        call_args = mock_embedding_service.embed_document.call_args
+        args, kwargs = mock_embedding_service.embed_document.call_args
         # Verify incident_id was passed
-        assert call_args[0][0] == incident_id or call_args[1].get("incident_id") == incident_id
+        assert kwargs.get("incident_id", args[0] if args else None) == incident_id
 
     @patch('backend.workflows.tasks.postmortem_tasks.embedding_service')
     def test_embed_empty_document(self, mock_embedding_service):
@@ -87,7 +97,7 @@ Database connection pool exhaustion.
         document = ""
 
         # Act & Assert
-        with pytest.raises(ValueError, match="empty|document"):
+        with pytest.raises(ValueError, match=_RE_EMPTY):
             embed_in_chromadb(incident_id, document)
 
     @patch('backend.workflows.tasks.postmortem_tasks.embedding_service')
@@ -100,7 +110,7 @@ Database connection pool exhaustion.
         mock_embedding_service.embed_document.side_effect = Exception("ChromaDB connection error")
 
         # Act & Assert
-        with pytest.raises(Exception, match="ChromaDB connection error"):
+        with pytest.raises(Exception, match=_RE_CHROMADB):
             embed_in_chromadb(incident_id, document)
 
     @patch('backend.workflows.tasks.postmortem_tasks.embedding_service')
@@ -114,8 +124,7 @@ Database connection pool exhaustion.
         """Test that large documents are properly chunked for embedding."""
         # Arrange
         incident_id = str(uuid.uuid4())
-        # Create a large document
-        large_document = "# Postmortem\n\n" + ("This is a test paragraph. " * 1000)
+        large_document = _LARGE_DOCUMENT
 
         mock_embedding_service.embed_document.return_value = {
             "embedding_id": str(uuid.uuid4()),
@@ -178,10 +187,9 @@ Database connection pool exhaustion.
         # Arrange
         incident_id = str(uuid.uuid4())
         document = "# Postmortem content"
-        embedding_id = str(uuid.uuid4())
 
         mock_embedding_service.embed_document.return_value = {
-            "embedding_id": embedding_id,
+            "embedding_id": _FIXED_EMBEDDING_ID,
             "collection": "postmortems",
             "status": "indexed"
         }
@@ -190,6 +198,21 @@ Database connection pool exhaustion.
         result = embed_in_chromadb(incident_id, document)
 
         # Assert
-        assert result["embedding_id"] == embedding_id
-        # Verify it's a valid UUID
-        uuid.UUID(result["embedding_id"])
+        assert result["embedding_id"] == _FIXED_EMBEDDING_ID
+
+    @patch('backend.workflows.tasks.postmortem_tasks.embedding_service')
+    def test_embed_document_bumps_search_generation(self, mock_embedding_service, mock_postmortem_cache):
+        """Test that indexing a postmortem invalidates cached runbook searches."""
+        # Arrange
+        incident_id = str(uuid.uuid4())
+        mock_embedding_service.embed_document.return_value = {
+            "embedding_id": _FIXED_EMBEDDING_ID,
+            "collection": "postmortems",
+            "status": "indexed"
+        }
+
+        # Act
+        embed_in_chromadb({"rendered_document": "# Postmortem content"}, incident_id)
+
+        # Assert
+        mock_postmortem_cache.incr.assert_called_once_with(postmortem_tasks.SEARCH_GENERATION_KEY)
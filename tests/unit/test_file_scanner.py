@@ -0,0 +1,109 @@
+"""
+Unit test for FileScanner directory scanning.
+
+Tests scan_directory against a real temporary directory tree.
+"""
+
+import hashlib
+import os
+
+import pytest
+
+file_scanner_module = pytest.importorskip("backend.utils.file_scanner", reason="Implementation not yet complete")
+FileScanner = file_scanner_module.FileScanner
+
+
+@pytest.fixture
+def runbook_tree(tmp_path):
+    """Create a small runbook tree with nested and non-matching files."""
+    (tmp_path / "db.md").write_text("# DB")
+    (tmp_path / "notes.txt").write_text("ignore me")
+    (tmp_path / "network").mkdir()
+    (tmp_path / "network" / "dns.md").write_text("# DNS")
+    (tmp_path / "network" / "deep").mkdir()
+    (tmp_path / "network" / "deep" / "bgp.md").write_text("# BGP")
+    (tmp_path / "empty").mkdir()
+    return tmp_path
+
+
+class TestFileScanner:
+    """Unit tests for FileScanner.scan_directory."""
+
+    def test_scan_directory_recursive(self, runbook_tree):
+        """Test that matching files are found at every depth with stat metadata."""
+        # Act
+        result = FileScanner().scan_directory(str(runbook_tree))
+
+        # Assert
+        paths = sorted(os.path.relpath(f["path"], runbook_tree) for f in result["files"])
+        assert paths == ["db.md", os.path.join("network", "deep", "bgp.md"), os.path.join("network", "dns.md")]
+        assert result["total_files"] == 3
+
+        db = next(f for f in result["files"] if f["path"].endswith("db.md"))
+        st = os.stat(runbook_tree / "db.md")
+        assert db["mtime"] == st.st_mtime
+        assert db["size"] == st.st_size
+
+    def test_scan_directory_non_recursive(self, runbook_tree):
+        """Test that only top-level files are returned when recursive=False."""
+        # Act
+        result = FileScanner().scan_directory(str(runbook_tree), recursive=False)
+
+        # Assert
+        assert [os.path.basename(f["path"]) for f in result["files"]] == ["db.md"]
+
+    def test_scan_directory_custom_pattern(self, runbook_tree):
+        """Test that the pattern filters by file name."""
+        # Act
+        result = FileScanner().scan_directory(str(runbook_tree), pattern="*.txt")
+
+        # Assert
+        assert [os.path.basename(f["path"]) for f in result["files"]] == ["notes.txt"]
+
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="Symlinks not supported")
+    def test_scan_directory_does_not_follow_dir_symlinks(self, runbook_tree, tmp_path_factory):
+        """Test that symlinked directories are not descended into, like os.walk."""
+        # Arrange
+        outside = tmp_path_factory.mktemp("outside")
+        (outside / "external.md").write_text("# External")
+        os.symlink(outside, runbook_tree / "linked", target_is_directory=True)
+
+        # Act
+        result = FileScanner().scan_directory(str(runbook_tree))
+
+        # Assert
+        assert not any(f["path"].endswith("external.md") for f in result["files"])
+        assert result["total_files"] == 3
+
+    def test_scan_directory_many_subtrees(self, tmp_path):
+        """Test that subtrees walked in parallel are all merged into the result."""
+        # Arrange
+        for i in range(20):
+            subtree = tmp_path / f"team{i}" / "nested"
+            subtree.mkdir(parents=True)
+            (subtree / f"runbook{i}.md").write_text(f"# Runbook {i}")
+
+        # Act
+        result = FileScanner().scan_directory(str(tmp_path))
+
+        # Assert
+        names = sorted(os.path.basename(f["path"]) for f in result["files"])
+        assert names == sorted(f"runbook{i}.md" for i in range(20))
+        assert result["total_files"] == 20
+
+    def test_scan_directory_missing(self, tmp_path):
+        """Test that a missing directory raises FileNotFoundError."""
+        # Act & Assert
+        with pytest.raises(FileNotFoundError):
+            FileScanner().scan_directory(str(tmp_path / "missing"))
+
+    def test_get_file_hash(self, runbook_tree):
+        """Test that the file hash is the SHA256 of the file content."""
+        # Arrange
+        expected = hashlib.sha256(b"# DB").hexdigest()
+
+        # Act
+        result = FileScanner().get_file_hash(str(runbook_tree / "db.md"))
+
+        # Assert
+        assert result == expected
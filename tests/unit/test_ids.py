@@ -0,0 +1,37 @@
+"""
+Unit test for UUIDv7 identifier generation.
+
+Tests that generated IDs are valid version 7 UUIDs and sort by creation time.
+"""
+
+import uuid
+from unittest.mock import patch
+
+from backend.utils.ids import uuid7
+
+
+class TestUuid7:
+    """Unit tests for uuid7."""
+
+    def test_uuid7_version_and_variant(self):
+        """Test that generated IDs carry the v7 version and RFC 4122 variant."""
+        # Act
+        value = uuid7()
+
+        # Assert
+        assert isinstance(value, uuid.UUID)
+        assert value.version == 7
+        assert value.variant == uuid.RFC_4122
+
+    def test_uuid7_time_ordered(self):
+        """Test that IDs from later milliseconds sort after earlier ones."""
+        # Arrange
+        timestamps = [1_700_000_000_000_000_000 + i * 1_000_000 for i in range(100)]
+
+        # Act
+        with patch("backend.utils.ids.time.time_ns", side_effect=timestamps):
+            values = [uuid7() for _ in timestamps]
+
+        # Assert
+        assert values == sorted(values)
+        assert [str(v) for v in values] == sorted(str(v) for v in values)
@@ -7,25 +7,37 @@ TDD: This test should FAIL initially before implementation.
 """
 
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import MagicMock, patch
 
 # These imports will fail until implementation exists - that's expected for TDD
-try:
-    from backend.workflows.tasks.kb_sync_tasks import invalidate_cache
-except ImportError:
-    pytest.skip("Implementation not yet complete", allow_module_level=True)
+kb_sync_tasks = pytest.importorskip("backend.workflows.tasks.kb_sync_tasks", reason="Implementation not yet complete")
+invalidate_cache = kb_sync_tasks.invalidate_cache
+invalidate_cache_many = kb_sync_tasks.invalidate_cache_many
+workflow_cache = pytest.importorskip("backend.services.workflow_cache", reason="Implementation not yet complete")
+WorkflowCache = workflow_cache.WorkflowCache
+_reset_workflow_cache_pool = workflow_cache._reset_workflow_cache_pool
 
 
 class TestInvalidateCache:
     """Unit tests for invalidate_cache task."""
 
-    @patch('backend.workflows.tasks.kb_sync_tasks.workflow_cache')
-    def test_invalidate_cache_success(self, mock_cache):
-        """Test successful cache invalidation."""
+    @pytest.mark.parametrize(
+        "cache_keys",
+        [
+            ["runbook:db_troubleshooting", "runbook:api_recovery"],
+            [],
+            ["runbook:db_troubleshooting", "runbook:api_recovery", "runbook:network_debugging"],
+            # Related search and embedding caches are invalidated with the runbook
+            ["runbook:doc", "search:runbook:doc", "embedding:runbook:doc"],
+            [f"runbook:doc{i}" for i in range(100)],
+        ],
+        ids=["success", "empty_list", "specific_runbooks", "related_caches", "large_batch"]
+    )
+    def test_invalidate_cache_variants(self, mock_workflow_cache, cache_keys):
+        """Test that the task forwards keys and reports the invalidated count."""
         # Arrange
-        cache_keys = ["runbook:db_troubleshooting", "runbook:api_recovery"]
-        mock_cache.invalidate_keys.return_value = {
-            "invalidated_keys": 2,
+        mock_workflow_cache.invalidate_keys.return_value = {
+            "invalidated_keys": len(cache_keys),
             "status": "success"
         }
 
@@ -33,111 +45,102 @@ class TestInvalidateCache:
         result = invalidate_cache(cache_keys)
 
         # Assert
-        assert result is not None
-        assert "invalidated_keys" in result
-        assert "status" in result
+        mock_workflow_cache.invalidate_keys.assert_called_once_with(cache_keys)
+        assert result["invalidated_keys"] == len(cache_keys)
         assert result["status"] == "success"
-        assert result["invalidated_keys"] == 2
 
-    @patch('backend.workflows.tasks.kb_sync_tasks.workflow_cache')
-    def test_invalidate_cache_empty_list(self, mock_cache):
-        """Test invalidation with no cache keys."""
-        # Arrange
-        cache_keys = []
-        mock_cache.invalidate_keys.return_value = {
-            "invalidated_keys": 0,
-            "status": "success"
-        }
-
-        # Act
-        result = invalidate_cache(cache_keys)
-
-        # Assert
-        assert result["invalidated_keys"] == 0
-        assert result["status"] == "success"
-
-    @patch('backend.workflows.tasks.kb_sync_tasks.workflow_cache')
-    def test_invalidate_cache_with_retry(self, mock_cache):
+    def test_invalidate_cache_with_retry(self, mock_workflow_cache):
         """Test retry behavior when cache invalidation fails."""
         # Arrange
         cache_keys = ["runbook:test"]
-        mock_cache.invalidate_keys.side_effect = Exception("Redis connection error")
+        mock_workflow_cache.invalidate_keys.side_effect = Exception("Redis connection error")
 
         # Act & Assert
         with pytest.raises(Exception, match="Redis connection error"):
             invalidate_cache(cache_keys)
 
-    @patch('backend.workflows.tasks.kb_sync_tasks.workflow_cache')
-    def test_invalidate_cache_max_retries(self, mock_cache):
+        # Verify retries back off exponentially with jitter
+        assert invalidate_cache.retry_backoff == 10
+        assert invalidate_cache.retry_backoff_max == 3600
+        assert invalidate_cache.retry_jitter is True
+
+    def test_invalidate_cache_max_retries(self, mock_workflow_cache):
         """Test that task respects max_retries=3 configuration."""
         # Verify task configuration
         assert invalidate_cache.max_retries == 3
 
-    @patch('backend.workflows.tasks.kb_sync_tasks.workflow_cache')
-    def test_invalidate_cache_pattern_matching(self, mock_cache):
-        """Test cache invalidation with pattern matching."""
+    @patch('backend.services.workflow_cache.redis')
+    def test_invalidate_cache_pattern_matching(self, mock_redis):
+        """Test that wildcard patterns are resolved with SCAN instead of KEYS."""
         # Arrange
         # Use wildcard pattern to invalidate multiple keys
         cache_keys = ["runbook:*"]
-        mock_cache.invalidate_keys.return_value = {
-            "invalidated_keys": 5,  # Pattern matched 5 keys
-            "status": "success"
-        }
+        mock_client = mock_redis.Redis.return_value
+        mock_client.scan_iter.return_value = iter(
+            [f"runbook:doc{i}" for i in range(5)]
+        )
+        mock_client.pipeline.return_value.execute.return_value = [1] * 5  # One UNLINK per matched key
 
         # Act
-        result = invalidate_cache(cache_keys)
+        with patch('backend.workflows.tasks.kb_sync_tasks.workflow_cache', WorkflowCache()):
+            result = invalidate_cache(cache_keys)
 
         # Assert
         assert result["invalidated_keys"] == 5
+        mock_client.scan_iter.assert_called_once_with(match="runbook:*", count=1000)
+        mock_client.keys.assert_not_called()
+        mock_client.delete.assert_not_called()
 
-    @patch('backend.workflows.tasks.kb_sync_tasks.workflow_cache')
-    def test_invalidate_cache_specific_runbooks(self, mock_cache):
-        """Test invalidation of specific runbook caches."""
+    @patch('backend.services.workflow_cache.redis')
+    def test_invalidate_cache_by_tag(self, mock_redis):
+        """Test that tag keys are resolved through their SET without scanning."""
         # Arrange
-        cache_keys = [
-            "runbook:db_troubleshooting",
-            "runbook:api_recovery",
-            "runbook:network_debugging"
+        cache_keys = ["tag:runbook:doc"]
+        mock_client = mock_redis.Redis.return_value
+        smembers_pipe, unlink_pipe = MagicMock(), MagicMock()
+        mock_client.pipeline.side_effect = [smembers_pipe, unlink_pipe]
+        smembers_pipe.execute.return_value = [
+            {"runbook:doc", "search:runbook:doc", "embedding:runbook:doc"}
         ]
-        mock_cache.invalidate_keys.return_value = {
-            "invalidated_keys": 3,
-            "status": "success"
-        }
+        unlink_pipe.execute.return_value = [1, 1, 1, 1]
 
         # Act
-        result = invalidate_cache(cache_keys)
+        result = WorkflowCache().invalidate_keys(cache_keys)
 
         # Assert
-        mock_cache.invalidate_keys.assert_called_once_with(cache_keys)
+        smembers_pipe.smembers.assert_called_once_with("tag:runbook:doc")
+        unlinked = {call.args[0] for call in unlink_pipe.unlink.call_args_list}
+        assert unlinked == {
+            "runbook:doc", "search:runbook:doc", "embedding:runbook:doc", "tag:runbook:doc"
+        }
+        # The tag set itself is removed but not counted as an invalidated entry
         assert result["invalidated_keys"] == 3
+        assert result["status"] == "success"
+        mock_client.scan_iter.assert_not_called()
+        mock_client.keys.assert_not_called()
 
-    @patch('backend.workflows.tasks.kb_sync_tasks.workflow_cache')
-    def test_invalidate_cache_related_caches(self, mock_cache):
-        """Test that related caches are also invalidated."""
+    @patch('backend.services.workflow_cache.redis')
+    def test_set_tagged_only_extends_tag_ttl(self, mock_redis):
+        """Test that writing a short-lived key never shortens its tag set's TTL."""
         # Arrange
-        cache_keys = [
-            "runbook:doc",
-            "search:runbook:doc",  # Related search cache
-            "embedding:runbook:doc"  # Related embedding cache
-        ]
-        mock_cache.invalidate_keys.return_value = {
-            "invalidated_keys": 3,
-            "status": "success"
-        }
+        pipe = mock_redis.Redis.return_value.pipeline.return_value
 
         # Act
-        result = invalidate_cache(cache_keys)
+        result = WorkflowCache().set_tagged("pm:render:abc", {"format": "markdown"}, ["postmortem:1"], ttl_seconds=60)
 
         # Assert
-        assert result["invalidated_keys"] == 3
+        assert result is True
+        pipe.sadd.assert_called_once_with("tag:postmortem:1", "pm:render:abc")
+        assert [c.kwargs for c in pipe.expire.call_args_list] == [{"nx": True}, {"gt": True}]
+        assert all(c.args == ("tag:postmortem:1", 60) for c in pipe.expire.call_args_list)
+        pipe.execute.assert_called_once()
 
-    @patch('backend.workflows.tasks.kb_sync_tasks.workflow_cache')
-    def test_invalidate_cache_partial_failure(self, mock_cache):
+    def test_invalidate_cache_partial_failure(self, mock_workflow_cache):
         """Test handling of partial cache invalidation failure."""
         # Arrange
         cache_keys = ["runbook:doc1", "runbook:doc2", "runbook:doc3"]
         # Some keys invalidated successfully, some failed
-        mock_cache.invalidate_keys.return_value = {
+        mock_workflow_cache.invalidate_keys.return_value = {
             "invalidated_keys": 2,
             "status": "partial",
             "failed": ["runbook:doc3"]
@@ -150,30 +153,83 @@ class TestInvalidateCache:
         assert result["invalidated_keys"] == 2
         assert result["status"] == "partial"
 
-    @patch('backend.workflows.tasks.kb_sync_tasks.workflow_cache')
-    def test_invalidate_cache_redis_unavailable(self, mock_cache):
+    @patch('backend.services.workflow_cache.redis')
+    def test_invalidate_cache_partial_failure_reports_failed_keys(self, mock_redis):
+        """Test that per-key UNLINK errors are reported without failing the batch."""
+        # Arrange
+        cache_keys = ["runbook:doc1", "runbook:doc2", "runbook:doc3"]
+        mock_client = mock_redis.Redis.return_value
+        mock_pipe = mock_client.pipeline.return_value
+        mock_pipe.execute.return_value = [1, 1, Exception("WRONGTYPE")]
+
+        # Act
+        result = WorkflowCache().invalidate_keys(cache_keys)
+
+        # Assert
+        assert result["invalidated_keys"] == 2
+        assert result["status"] == "partial"
+        assert result["failed"] == ["runbook:doc3"]
+        assert mock_pipe.unlink.call_count == 3
+        mock_pipe.execute.assert_called_once_with(raise_on_error=False)
+        mock_client.delete.assert_not_called()
+
+    def test_invalidate_cache_redis_unavailable(self, mock_workflow_cache):
         """Test behavior when Redis is unavailable."""
         # Arrange
         cache_keys = ["runbook:test"]
-        mock_cache.invalidate_keys.side_effect = Exception("Redis unavailable")
+        mock_workflow_cache.invalidate_keys.side_effect = Exception("Redis unavailable")
 
         # Act & Assert
         with pytest.raises(Exception, match="Redis unavailable"):
             invalidate_cache(cache_keys)
 
-    @patch('backend.workflows.tasks.kb_sync_tasks.workflow_cache')
-    def test_invalidate_cache_large_batch(self, mock_cache):
-        """Test invalidation of large batch of cache keys."""
+    @patch('backend.workflows.tasks.kb_sync_tasks.group')
+    def test_invalidate_cache_chunked_enqueue(self, mock_group):
+        """Test that large key sets are enqueued as one group of 200-key batches."""
         # Arrange
-        cache_keys = [f"runbook:doc{i}" for i in range(100)]
-        mock_cache.invalidate_keys.return_value = {
-            "invalidated_keys": 100,
-            "status": "success"
-        }
+        cache_keys = [f"runbook:doc{i}" for i in range(450)]
 
         # Act
-        result = invalidate_cache(cache_keys)
+        invalidate_cache_many(cache_keys)
 
         # Assert
-        assert result["invalidated_keys"] == 100
-        assert result["status"] == "success"
+        mock_group.assert_called_once()
+        signatures = mock_group.call_args[0][0]
+        assert [len(sig.args[0]) for sig in signatures] == [200, 200, 50]
+        assert signatures[0].args[0] == cache_keys[:200]
+        mock_group.return_value.apply_async.assert_called_once()
+
+    @patch('backend.services.workflow_cache.redis')
+    def test_workflow_cache_uses_blocking_pool(self, mock_redis):
+        """Test that the cache draws connections from a bounded blocking pool."""
+        # Act
+        cache = WorkflowCache()
+
+        # Assert
+        mock_redis.BlockingConnectionPool.from_url.assert_called_once_with(
+            cache.redis_url,
+            max_connections=32,
+            timeout=5,
+            decode_responses=True
+        )
+        mock_redis.Redis.assert_called_once_with(connection_pool=cache.pool)
+
+    @patch('backend.services.workflow_cache.redis')
+    def test_workflow_cache_pool_sized_from_env(self, mock_redis, monkeypatch):
+        """Test that the pool can be sized to a high-concurrency worker."""
+        # Arrange
+        monkeypatch.setenv("REDIS_MAX_CONNECTIONS", "100")
+
+        # Act
+        WorkflowCache()
+
+        # Assert
+        assert mock_redis.BlockingConnectionPool.from_url.call_args.kwargs["max_connections"] == 100
+
+    def test_workflow_cache_pool_reset_after_fork(self, mock_workflow_cache):
+        """Test that each forked worker process resets the shared pool."""
+        # Act
+        _reset_workflow_cache_pool(sender=None)
+
+        # Assert
+        mock_workflow_cache.reset_pool.assert_called_once()
@@ -8,20 +8,20 @@ TDD: This test should FAIL initially before implementation.
 
 import pytest
 import uuid
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
 
 # These imports will fail until implementation exists - that's expected for TDD
-try:
-    from backend.workflows.tasks.postmortem_tasks import notify_stakeholders
-except ImportError:
-    pytest.skip("Implementation not yet complete", allow_module_level=True)
+postmortem_tasks = pytest.importorskip("backend.workflows.tasks.postmortem_tasks", reason="Implementation not yet complete")
+notify_stakeholders = postmortem_tasks.notify_stakeholders
+notify_stakeholders_bulk = postmortem_tasks.notify_stakeholders_bulk
+from backend.services.notification_service import NotificationError
 
 
 class TestNotifyStakeholders:
     """Unit tests for notify_stakeholders task."""
 
-    @patch('backend.workflows.tasks.postmortem_tasks.notification_service')
-    def test_notify_stakeholders_success(self, mock_notification_service):
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_notify_stakeholders_success(self, mock_notification_service_class):
         """Test successful notification to stakeholders."""
         # Arrange
         incident_id = str(uuid.uuid4())
@@ -30,10 +30,10 @@ class TestNotifyStakeholders:
             "summary": "API service outage postmortem available"
         }
 
-        mock_notification_service.send_notification.return_value = {
+        mock_notification_service_class.return_value.send.return_value = {
             "sent_to": ["webhook", "email"],
-            "status": "success",
-            "recipients": 5
+            "failed": [],
+            "status": "success"
         }
 
         # Act
@@ -47,8 +47,8 @@ class TestNotifyStakeholders:
         assert isinstance(result["sent_to"], list)
         assert len(result["sent_to"]) > 0
 
-    @patch('backend.workflows.tasks.postmortem_tasks.notification_service')
-    def test_notify_stakeholders_with_github_url(self, mock_notification_service):
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_notify_stakeholders_with_github_url(self, mock_notification_service_class):
         """Test that GitHub URL is included in notification."""
         # Arrange
         incident_id = str(uuid.uuid4())
@@ -58,23 +58,23 @@ class TestNotifyStakeholders:
             "summary": "Postmortem available"
         }
 
-        mock_notification_service.send_notification.return_value = {
+        mock_service = mock_notification_service_class.return_value
+        mock_service.send.return_value = {
             "sent_to": ["webhook"],
-            "status": "success",
-            "recipients": 3
+            "failed": [],
+            "status": "success"
         }
 
         # Act
         result = notify_stakeholders(incident_id, postmortem_data)
 
         # Assert
-        mock_notification_service.send_notification.assert_called_once()
-        call_args = mock_notification_service.send_notification.call_args
+        mock_service.send.assert_called_once()
         # Verify GitHub URL was passed
-        assert github_url in str(call_args)
+        assert mock_service.send.call_args.kwargs["metadata"]["github_url"] == github_url
 
-    @patch('backend.workflows.tasks.postmortem_tasks.notification_service')
-    def test_notify_stakeholders_partial_success(self, mock_notification_service):
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_notify_stakeholders_partial_success(self, mock_notification_service_class):
         """Test handling of partial notification success."""
         # Arrange
         incident_id = str(uuid.uuid4())
@@ -84,11 +84,10 @@ class TestNotifyStakeholders:
         }
 
         # Webhook succeeds but email fails
-        mock_notification_service.send_notification.return_value = {
+        mock_notification_service_class.return_value.send.return_value = {
             "sent_to": ["webhook"],
             "failed": ["email"],
-            "status": "partial",
-            "recipients": 3
+            "status": "partial"
         }
 
         # Act
@@ -97,9 +96,10 @@ class TestNotifyStakeholders:
         # Assert
         assert result["status"] == "partial"
         assert "webhook" in result["sent_to"]
+        assert result["failed"] == ["email"]
 
-    @patch('backend.workflows.tasks.postmortem_tasks.notification_service')
-    def test_notify_stakeholders_complete_failure(self, mock_notification_service):
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_notify_stakeholders_complete_failure(self, mock_notification_service_class):
         """Test handling of complete notification failure."""
         # Arrange
         incident_id = str(uuid.uuid4())
@@ -108,20 +108,16 @@ class TestNotifyStakeholders:
             "summary": "Postmortem available"
         }
 
-        mock_notification_service.send_notification.return_value = {
-            "sent_to": [],
-            "status": "failed",
-            "error": "All notification channels unavailable"
-        }
-
-        # Act
-        result = notify_stakeholders(incident_id, postmortem_data)
+        mock_notification_service_class.return_value.send.side_effect = NotificationError(
+            "All notification channels failed"
+        )
 
-        # Assert
-        assert result["status"] == "failed"
+        # Act & Assert: raised so autoretry_for can retry it
+        with pytest.raises(NotificationError):
+            notify_stakeholders(incident_id, postmortem_data)
 
-    @patch('backend.workflows.tasks.postmortem_tasks.notification_service')
-    def test_notify_stakeholders_missing_github_url(self, mock_notification_service):
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_notify_stakeholders_missing_github_url(self, mock_notification_service_class):
         """Test error handling when GitHub URL is missing."""
         # Arrange
         incident_id = str(uuid.uuid4())
@@ -134,8 +130,27 @@ class TestNotifyStakeholders:
         with pytest.raises((ValueError, KeyError)):
             notify_stakeholders(incident_id, postmortem_data)
 
-    @patch('backend.workflows.tasks.postmortem_tasks.notification_service')
-    def test_notify_stakeholders_with_retry(self, mock_notification_service):
+        mock_notification_service_class.return_value.send.assert_not_called()
+
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_notify_stakeholders_invalid_github_url(self, mock_notification_service_class):
+        """Test that a malformed GitHub URL is rejected without retrying."""
+        # Arrange
+        incident_id = str(uuid.uuid4())
+        postmortem_data = {
+            "github_url": "not-a-url",
+            "summary": "Postmortem available"
+        }
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            notify_stakeholders(incident_id, postmortem_data)
+
+        mock_notification_service_class.return_value.send.assert_not_called()
+        assert ValueError in notify_stakeholders.dont_autoretry_for
+
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_notify_stakeholders_with_retry(self, mock_notification_service_class):
         """Test retry behavior when notification service fails."""
         # Arrange
         incident_id = str(uuid.uuid4())
@@ -144,20 +159,47 @@ class TestNotifyStakeholders:
             "summary": "Postmortem available"
         }
 
-        mock_notification_service.send_notification.side_effect = Exception("Service unavailable")
+        error = NotificationError("Service unavailable")
+        mock_notification_service_class.return_value.send.side_effect = error
+
+        # Act & Assert: called directly, retry() re-raises the original error
+        with patch.object(notify_stakeholders, "retry", wraps=notify_stakeholders.retry) as mock_retry:
+            with pytest.raises(NotificationError, match="Service unavailable"):
+                notify_stakeholders(incident_id, postmortem_data)
+
+        # Verify the failure went through autoretry_for with a backoff countdown
+        mock_retry.assert_called_once()
+        assert mock_retry.call_args.kwargs["exc"] is error
+        assert "countdown" in mock_retry.call_args.kwargs
+
+        # Verify retries back off exponentially with jitter
+        assert notify_stakeholders.retry_backoff == 10
+        assert notify_stakeholders.retry_backoff_max == 3600
+        assert notify_stakeholders.retry_jitter is True
+
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_notify_stakeholders_validation_error_not_retried(self, mock_notification_service_class):
+        """Test that invalid postmortem data is excluded from autoretry_for."""
+        # Arrange
+        incident_id = str(uuid.uuid4())
+        postmortem_data = {"summary": "Postmortem available"}
 
         # Act & Assert
-        with pytest.raises(Exception, match="Service unavailable"):
-            notify_stakeholders(incident_id, postmortem_data)
+        with patch.object(notify_stakeholders, "retry", wraps=notify_stakeholders.retry) as mock_retry:
+            with pytest.raises(ValueError):
+                notify_stakeholders(incident_id, postmortem_data)
+
+        mock_retry.assert_not_called()
+        mock_notification_service_class.return_value.send.assert_not_called()
 
-    @patch('backend.workflows.tasks.postmortem_tasks.notification_service')
-    def test_notify_stakeholders_max_retries(self, mock_notification_service):
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_notify_stakeholders_max_retries(self, mock_notification_service_class):
         """Test that task respects max_retries=3 configuration."""
         # Verify task configuration
         assert notify_stakeholders.max_retries == 3
 
-    @patch('backend.workflows.tasks.postmortem_tasks.notification_service')
-    def test_notify_stakeholders_multiple_channels(self, mock_notification_service):
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_notify_stakeholders_multiple_channels(self, mock_notification_service_class):
         """Test notification to multiple channels."""
         # Arrange
         incident_id = str(uuid.uuid4())
@@ -166,10 +208,10 @@ class TestNotifyStakeholders:
             "summary": "Postmortem available"
         }
 
-        mock_notification_service.send_notification.return_value = {
+        mock_notification_service_class.return_value.send.return_value = {
             "sent_to": ["webhook", "email", "slack"],
-            "status": "success",
-            "recipients": 10
+            "failed": [],
+            "status": "success"
         }
 
         # Act
@@ -181,8 +223,8 @@ class TestNotifyStakeholders:
         assert "email" in result["sent_to"]
         assert "slack" in result["sent_to"]
 
-    @patch('backend.workflows.tasks.postmortem_tasks.notification_service')
-    def test_notify_stakeholders_includes_summary(self, mock_notification_service):
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_notify_stakeholders_includes_summary(self, mock_notification_service_class):
         """Test that summary is included in notification."""
         # Arrange
         incident_id = str(uuid.uuid4())
@@ -192,24 +234,24 @@ class TestNotifyStakeholders:
             "summary": summary
         }
 
-        mock_notification_service.send_notification.return_value = {
+        mock_service = mock_notification_service_class.return_value
+        mock_service.send.return_value = {
             "sent_to": ["webhook"],
-            "status": "success",
-            "recipients": 5
+            "failed": [],
+            "status": "success"
         }
 
         # Act
         result = notify_stakeholders(incident_id, postmortem_data)
 
         # Assert
-        mock_notification_service.send_notification.assert_called_once()
-        call_args = mock_notification_service.send_notification.call_args
+        mock_service.send.assert_called_once()
         # Verify summary was passed
-        assert summary in str(call_args) or call_args[1].get("summary") == summary
+        assert summary in mock_service.send.call_args.kwargs["message"]
 
-    @patch('backend.workflows.tasks.postmortem_tasks.notification_service')
-    def test_notify_stakeholders_recipient_count(self, mock_notification_service):
-        """Test that recipient count is tracked."""
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_notify_stakeholders_webhook_not_configured(self, mock_notification_service_class):
+        """Test that an unconfigured webhook is skipped instead of retried."""
         # Arrange
         incident_id = str(uuid.uuid4())
         postmortem_data = {
@@ -217,15 +259,89 @@ class TestNotifyStakeholders:
             "summary": "Postmortem available"
         }
 
-        mock_notification_service.send_notification.return_value = {
-            "sent_to": ["webhook"],
-            "status": "success",
-            "recipients": 15
+        mock_service = mock_notification_service_class.return_value
+        mock_service.webhook_enabled = False
+
+        # Act
+        result = notify_stakeholders(incident_id, postmortem_data)
+        bulk_result = notify_stakeholders_bulk([[incident_id, postmortem_data]])
+
+        # Assert
+        assert result["status"] == "skipped"
+        assert result["sent_to"] == []
+        assert result["failed"] == []
+        assert bulk_result == [{"incident_id": incident_id, **result}]
+        mock_service.send.assert_not_called()
+        mock_service.send_bulk.assert_not_called()
+
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_notify_stakeholders_bulk(self, mock_notification_service_class):
+        """Test that many postmortems are notified through one bulk send."""
+        # Arrange
+        pairs = [
+            [str(uuid.uuid4()), {
+                "github_url": f"https://github.com/org/repo/issues/{i}",
+                "summary": f"Postmortem {i} available"
+            }]
+            for i in range(3)
+        ]
+
+        mock_service = mock_notification_service_class.return_value
+        mock_service.send_bulk.return_value = [
+            {"sent_to": ["webhook"], "failed": [], "status": "success"},
+            {"sent_to": [], "failed": ["webhook"], "status": "failed"},
+            {"sent_to": ["webhook"], "failed": [], "status": "success"}
+        ]
+
+        # Act
+        result = notify_stakeholders_bulk(pairs)
+
+        # Assert
+        mock_service.send_bulk.assert_called_once()
+        notifications = mock_service.send_bulk.call_args[0][0]
+        assert len(notifications) == 3
+        assert notifications[1]["metadata"]["github_url"] == "https://github.com/org/repo/issues/1"
+        assert [r["incident_id"] for r in result] == [pair[0] for pair in pairs]
+        assert result[1]["status"] == "failed"
+
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_notify_stakeholders_bulk_invalid_entry(self, mock_notification_service_class):
+        """Test that an invalid entry fails the batch before anything is sent."""
+        # Arrange
+        pairs = [
+            [str(uuid.uuid4()), {"github_url": "https://github.com/org/repo/issues/1", "summary": "ok"}],
+            [str(uuid.uuid4()), {"summary": "Missing github_url"}]
+        ]
+
+        # Act & Assert
+        with pytest.raises(ValueError):
+            notify_stakeholders_bulk(pairs)
+
+        mock_notification_service_class.return_value.send_bulk.assert_not_called()
+
+    @patch('backend.workflows.tasks.postmortem_tasks.NotificationService')
+    def test_notify_stakeholders_sends_like_bulk(self, mock_notification_service_class):
+        """Test that a single notification goes through the same service path as a bulk one."""
+        # Arrange
+        incident_id = str(uuid.uuid4())
+        postmortem_data = {
+            "github_url": "https://github.com/org/repo/issues/456",
+            "summary": "Postmortem available"
         }
+        mock_service = mock_notification_service_class.return_value
+        mock_service.send.return_value = {"sent_to": ["webhook"], "failed": [], "status": "success"}
+        mock_service.send_bulk.return_value = [{"sent_to": ["webhook"], "failed": [], "status": "success"}]
 
         # Act
         result = notify_stakeholders(incident_id, postmortem_data)
+        notify_stakeholders_bulk([[incident_id, postmortem_data]])
+
+        # Assert
+        assert result["status"] == "success"
+        mock_service.send.assert_called_once_with(**mock_service.send_bulk.call_args[0][0][0])
 
+    def test_notify_stakeholders_bulk_retry_policy(self):
+        """Test that the bulk task retries like notify_stakeholders."""
         # Assert
-        assert "recipients" in result
-        assert result["recipients"] == 15
+        for option in ("max_retries", "retry_backoff", "retry_backoff_max", "retry_jitter", "dont_autoretry_for"):
+            assert getattr(notify_stakeholders_bulk, option) == getattr(notify_stakeholders, option)
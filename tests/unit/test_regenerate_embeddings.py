@@ -6,15 +6,18 @@ Tests the task that regenerates embeddings for a runbook file.
 TDD: This test should FAIL initially before implementation.
 """
 
+import mmap
 import pytest
 import uuid
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
 
 # These imports will fail until implementation exists - that's expected for TDD
-try:
-    from backend.workflows.tasks.kb_sync_tasks import regenerate_embeddings
-except ImportError:
-    pytest.skip("Implementation not yet complete", allow_module_level=True)
+kb_sync_tasks = pytest.importorskip("backend.workflows.tasks.kb_sync_tasks", reason="Implementation not yet complete")
+regenerate_embeddings = kb_sync_tasks.regenerate_embeddings
+regenerate_embeddings_batch = kb_sync_tasks.regenerate_embeddings_batch
+
+# Keep the search generation bump off Redis
+pytestmark = pytest.mark.usefixtures("mock_workflow_cache")
 
 
 class TestRegenerateEmbeddings:
@@ -68,6 +71,11 @@ class TestRegenerateEmbeddings:
         with pytest.raises(Exception, match="Service unavailable"):
             regenerate_embeddings(file_path)
 
+        # Verify retries back off exponentially with jitter
+        assert regenerate_embeddings.retry_backoff == 10
+        assert regenerate_embeddings.retry_backoff_max == 3600
+        assert regenerate_embeddings.retry_jitter is True
+
     @patch('backend.workflows.tasks.kb_sync_tasks.embedding_service')
     def test_regenerate_embeddings_max_retries(self, mock_embedding_service):
         """Test that task respects max_retries=3 configuration."""
@@ -136,6 +144,27 @@ class TestRegenerateEmbeddings:
         # Assert
         assert result["status"] == "embedded"
 
+    @patch('backend.workflows.tasks.kb_sync_tasks.embedding_service')
+    def test_regenerate_embeddings_file_name_metadata(self, mock_embedding_service, tmp_path):
+        """Test that the file name and extension are stored as metadata."""
+        # Arrange
+        runbook = tmp_path / "db_troubleshooting.md"
+        runbook.write_text("# Runbook", encoding="utf-8")
+        mock_embedding_service.embed_document.return_value = {
+            "embedding_id": str(uuid.uuid4()),
+            "collection": "runbooks",
+            "status": "embedded",
+            "chunks": 1
+        }
+
+        # Act
+        regenerate_embeddings(str(runbook))
+
+        # Assert
+        metadata = mock_embedding_service.embed_document.call_args.kwargs["metadata"]
+        assert metadata["file_name"] == "db_troubleshooting.md"
+        assert metadata["file_type"] == "md"
+
     @patch('backend.workflows.tasks.kb_sync_tasks.embedding_service')
     def test_regenerate_embeddings_updates_existing(self, mock_embedding_service):
         """Test that regenerating updates existing embeddings."""
@@ -173,3 +202,88 @@ class TestRegenerateEmbeddings:
         # Assert
         # Collection should be "runbooks" for knowledge base docs
         mock_embedding_service.embed_document.assert_called_once()
+
+    @patch('backend.workflows.tasks.kb_sync_tasks.embedding_service')
+    def test_regenerate_embeddings_uses_mmap(self, mock_embedding_service, tmp_path):
+        """Test that runbook content is read through a memory map."""
+        # Arrange
+        content = "# Runbook\n\nRestart the service."
+        runbook = tmp_path / "doc.md"
+        runbook.write_text(content, encoding="utf-8")
+        mock_embedding_service.embed_document.return_value = {
+            "embedding_id": str(uuid.uuid4()),
+            "collection": "runbooks",
+            "status": "embedded",
+            "chunks": 1
+        }
+
+        # Act
+        with patch('backend.workflows.tasks.kb_sync_tasks.mmap.mmap', wraps=mmap.mmap) as mock_mmap:
+            result = regenerate_embeddings(str(runbook))
+
+        # Assert
+        mock_mmap.assert_called_once()
+        assert result["status"] == "embedded"
+        assert mock_embedding_service.embed_document.call_args.kwargs["document"] == content
+
+    @patch('backend.workflows.tasks.kb_sync_tasks.embedding_service')
+    def test_regenerate_embeddings_batch_success(self, mock_embedding_service, tmp_path):
+        """Test that a batch of files is embedded with a single service call."""
+        # Arrange
+        file_paths = []
+        for i in range(32):
+            runbook = tmp_path / f"doc{i}.md"
+            runbook.write_text(f"# Runbook {i}", encoding="utf-8")
+            file_paths.append(str(runbook))
+        mock_embedding_service.embed_batch.return_value = [
+            {"embedding_id": str(uuid.uuid4()), "collection": "runbooks", "status": "indexed", "chunks": 1}
+            for _ in file_paths
+        ]
+
+        # Act
+        result = regenerate_embeddings_batch(file_paths)
+
+        # Assert
+        assert mock_embedding_service.embed_batch.call_count == 1
+        mock_embedding_service.embed_document.assert_not_called()
+        assert [r["file_path"] for r in result] == file_paths
+        assert all(r["status"] == "embedded" for r in result)
+
+    @patch('backend.workflows.tasks.kb_sync_tasks.embedding_service')
+    def test_regenerate_embeddings_bumps_search_generation(self, mock_embedding_service, mock_workflow_cache, tmp_path):
+        """Test that re-embedding a runbook invalidates cached runbook searches."""
+        # Arrange
+        runbook = tmp_path / "doc.md"
+        runbook.write_text("# Runbook", encoding="utf-8")
+        mock_embedding_service.embed_document.return_value = {
+            "embedding_id": str(uuid.uuid4()),
+            "collection": "runbooks",
+            "status": "indexed",
+            "chunks": 1
+        }
+
+        # Act
+        regenerate_embeddings(str(runbook))
+
+        # Assert
+        mock_workflow_cache.incr.assert_called_once_with(kb_sync_tasks.SEARCH_GENERATION_KEY)
+
+    @patch('backend.workflows.tasks.kb_sync_tasks.embedding_service')
+    def test_regenerate_embeddings_batch_bumps_search_generation(self, mock_embedding_service, mock_workflow_cache, tmp_path):
+        """Test that an embedded batch invalidates cached runbook searches once."""
+        # Arrange
+        file_paths = []
+        for i in range(3):
+            runbook = tmp_path / f"doc{i}.md"
+            runbook.write_text(f"# Runbook {i}", encoding="utf-8")
+            file_paths.append(str(runbook))
+        mock_embedding_service.embed_batch.return_value = [
+            {"embedding_id": str(uuid.uuid4()), "collection": "runbooks", "status": "indexed", "chunks": 1}
+            for _ in file_paths
+        ]
+
+        # Act
+        regenerate_embeddings_batch(file_paths)
+
+        # Assert
+        mock_workflow_cache.incr.assert_called_once_with(kb_sync_tasks.SEARCH_GENERATION_KEY)
@@ -8,14 +8,12 @@ TDD: This test should FAIL initially before implementation.
 
 import pytest
 import os
-from unittest.mock import Mock, patch, MagicMock
-from datetime import datetime
+from unittest.mock import patch
+from datetime import datetime, timezone
 
 # These imports will fail until implementation exists - that's expected for TDD
-try:
-    from backend.workflows.tasks.kb_sync_tasks import scan_runbooks_dir
-except ImportError:
-    pytest.skip("Implementation not yet complete", allow_module_level=True)
+kb_sync_tasks = pytest.importorskip("backend.workflows.tasks.kb_sync_tasks", reason="Implementation not yet complete")
+scan_runbooks_dir = kb_sync_tasks.scan_runbooks_dir
 
 
 class TestScanRunbooksDir:
@@ -160,3 +158,16 @@ class TestScanRunbooksDir:
         assert "scan_timestamp" in result
         # Verify it's a valid ISO timestamp
         datetime.fromisoformat(result["scan_timestamp"].replace("Z", "+00:00"))
+
+    @patch('backend.workflows.tasks.kb_sync_tasks.file_scanner')
+    def test_scan_runbooks_timestamp_is_utc(self, mock_scanner):
+        """Test that the "Z"-suffixed scan timestamp is actually UTC."""
+        # Arrange
+        mock_scanner.scan_directory.return_value = {"files": [], "total_files": 0}
+
+        # Act
+        result = scan_runbooks_dir("/runbooks")
+
+        # Assert
+        scanned_at = datetime.fromisoformat(result["scan_timestamp"].replace("Z", "+00:00"))
+        assert abs((datetime.now(timezone.utc) - scanned_at).total_seconds()) < 60
@@ -8,13 +8,11 @@ TDD: This test should FAIL initially before implementation.
 
 import pytest
 import uuid
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import patch
 
 # These imports will fail until implementation exists - that's expected for TDD
-try:
-    from backend.workflows.tasks.kb_sync_tasks import update_chromadb
-except ImportError:
-    pytest.skip("Implementation not yet complete", allow_module_level=True)
+kb_sync_tasks = pytest.importorskip("backend.workflows.tasks.kb_sync_tasks", reason="Implementation not yet complete")
+update_chromadb = kb_sync_tasks.update_chromadb
 
 
 class TestUpdateChromaDB:
@@ -195,3 +193,19 @@ class TestUpdateChromaDB:
         # Assert
         assert result["updated_count"] == 100
         assert result["status"] == "success"
+
+    @patch('backend.workflows.tasks.kb_sync_tasks.embedding_service')
+    def test_update_chromadb_bumps_search_generation(self, mock_embedding_service, mock_workflow_cache):
+        """Test that a successful update invalidates cached runbook searches."""
+        # Arrange
+        mock_embedding_service.batch_update.return_value = {
+            "updated_count": 1,
+            "deleted_count": 0,
+            "status": "success"
+        }
+
+        # Act
+        update_chromadb([{"file_path": "/runbooks/file.md", "embedding_id": str(uuid.uuid4())}], [])
+
+        # Assert
+        mock_workflow_cache.incr.assert_called_once_with(kb_sync_tasks.SEARCH_GENERATION_KEY)